@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+SAFES Log Tail
+==============
+Follows the memory-mapped console ring buffer written when the logger is
+set up with setup_logger(use_mmap_console=True).
+
+Run: python scripts/safes_tail.py [--path PATH] [--no-follow]
+"""
+
+import argparse
+import codecs
+import mmap
+import struct
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.utils.log_sinks import RING_HEADER, RING_TOTAL_OFFSET  # noqa: E402
+from src.utils.logger import MMAP_CONSOLE_PATH as DEFAULT_PATH  # noqa: E402
+
+
+def read_total(mm: mmap.mmap) -> int:
+    """Read the total-bytes-written counter from the ring header."""
+    return struct.unpack_from("<Q", mm, RING_TOTAL_OFFSET)[0]
+
+
+def read_range(mm: mmap.mmap, capacity: int, start: int, end: int) -> bytes:
+    """Read ring bytes for absolute positions [start, end), handling wrap-around."""
+    offset = start % capacity
+    size = end - start
+    first = min(size, capacity - offset)
+    base = RING_HEADER.size
+    data = mm[base + offset:base + offset + first]
+    if first < size:
+        data += mm[base:base + size - first]
+    return data
+
+
+def tail(path: str, follow: bool = True, interval: float = 0.1) -> None:
+    """
+    Print the buffered ring contents, then optionally follow new output.
+
+    Args:
+        path: Ring file path
+        follow: Keep printing new records as they are written
+        interval: Polling interval in seconds while following
+    """
+    with open(path, "rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    capacity = RING_HEADER.unpack_from(mm, 0)[0]
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    out = sys.stdout
+
+    total = read_total(mm)
+    position = max(0, total - capacity)
+
+    while True:
+        total = read_total(mm)
+
+        # Writer restarted and reset the ring
+        if total < position:
+            position = 0
+
+        # Fell behind by more than the ring holds; skip the overwritten part
+        if total - position > capacity:
+            skipped = total - capacity - position
+            out.write(f"\n[safes-tail] skipped {skipped} overwritten bytes\n")
+            position = total - capacity
+
+        if total > position:
+            data = read_range(mm, capacity, position, total)
+
+            # Discard the read if the writer lapped us while copying
+            if read_total(mm) - position <= capacity:
+                out.write(decoder.decode(data))
+                out.flush()
+                position = total
+            continue
+
+        if not follow:
+            break
+        time.sleep(interval)
+
+    mm.close()
+
+
+def main() -> int:
+    """Parse arguments and tail the ring buffer."""
+    parser = argparse.ArgumentParser(description="Follow the SAFES mmap console log.")
+    parser.add_argument("--path", default=DEFAULT_PATH, help="Ring buffer file path")
+    parser.add_argument("--no-follow", action="store_true", help="Print buffered output and exit")
+    parser.add_argument("--interval", type=float, default=0.1, help="Polling interval in seconds")
+    args = parser.parse_args()
+
+    ring = Path(args.path)
+    if not ring.exists() or ring.stat().st_size < RING_HEADER.size:
+        print(f"Ring buffer not found: {args.path}", file=sys.stderr)
+        print("Start the app with setup_logger(use_mmap_console=True).", file=sys.stderr)
+        return 1
+
+    try:
+        tail(args.path, follow=not args.no_follow, interval=args.interval)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,12 +8,61 @@ Run: python scripts/verify_setup.py
 """
 
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from importlib.metadata import PackageNotFoundError, version
+from importlib.util import find_spec
 from pathlib import Path
+from typing import Dict, List, Tuple
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+# Import probe: (module name, display name, distribution name)
+ImportProbe = Tuple[str, str, str]
+
+# spaCy model loaded at runtime by the NLP check
+SPACY_MODEL = "en_core_web_sm"
+
+# Library checks: (section header, summary name, probes)
+CHECKS: List[Tuple[str, str, List[ImportProbe]]] = [
+    ("CORE LIBRARY IMPORTS", "Core Libraries", [
+        ("fastapi", "FastAPI", "fastapi"),
+        ("uvicorn", "Uvicorn", "uvicorn"),
+        ("streamlit", "Streamlit", "streamlit"),
+        ("pydantic", "Pydantic", "pydantic"),
+        ("yaml", "PyYAML", "PyYAML"),
+    ]),
+    ("DOCUMENT PROCESSING", "Document Processing", [
+        ("pypdf", "PyPDF", "pypdf"),
+        ("pdfplumber", "PDFPlumber", "pdfplumber"),
+        ("docx", "python-docx", "python-docx"),
+    ]),
+    ("VECTOR DATABASE & EMBEDDINGS", "Vector & Embeddings", [
+        ("chromadb", "ChromaDB", "chromadb"),
+        ("faiss", "FAISS-CPU", "faiss-cpu"),
+        ("sentence_transformers", "Sentence-Transformers", "sentence-transformers"),
+    ]),
+    ("LLM INTEGRATION", "LLM Integration", [
+        ("openai", "OpenAI", "openai"),
+        # LangChain Core (new package structure)
+        ("langchain_core", "LangChain-Core", "langchain-core"),
+        ("langchain_community", "LangChain-Community", "langchain-community"),
+        ("langchain_openai", "LangChain-OpenAI", "langchain-openai"),
+        ("tiktoken", "Tiktoken", "tiktoken"),
+    ]),
+    ("NLP LIBRARIES", "NLP Libraries", [
+        ("nltk", "NLTK", "nltk"),
+        ("spacy", "spaCy", "spacy"),
+    ]),
+    ("UTILITIES", "Utilities", [
+        ("loguru", "Loguru", "loguru"),
+        ("tenacity", "Tenacity", "tenacity"),
+        ("dotenv", "python-dotenv", "python-dotenv"),
+        ("httpx", "HTTPX", "httpx"),
+    ]),
+]
+
 
 def print_header(title: str) -> None:
     """Print a formatted section header."""
@@ -29,189 +78,69 @@ def print_status(name: str, status: bool, version: str = "") -> None:
     print(f"  {icon} {name}{version_str}")
 
 
-def check_core_imports() -> bool:
-    """Check that all core libraries can be imported."""
-    print_header("CORE LIBRARY IMPORTS")
-    all_ok = True
-
-    libraries = [
-        ("fastapi", "FastAPI"),
-        ("uvicorn", "Uvicorn"),
-        ("streamlit", "Streamlit"),
-        ("pydantic", "Pydantic"),
-        ("yaml", "PyYAML"),
-    ]
-
-    for module, name in libraries:
-        try:
-            lib = __import__(module)
-            version = getattr(lib, "__version__", "unknown")
-            print_status(name, True, version)
-        except ImportError as e:
-            print_status(f"{name} - {e}", False)
-            all_ok = False
-
-    return all_ok
-
-
-def check_document_processing() -> bool:
-    """Check document processing libraries."""
-    print_header("DOCUMENT PROCESSING")
-    all_ok = True
-
-    libraries = [
-        ("pypdf", "PyPDF"),
-        ("pdfplumber", "PDFPlumber"),
-        ("docx", "python-docx"),
-    ]
-
-    for module, name in libraries:
-        try:
-            lib = __import__(module)
-            version = getattr(lib, "__version__", "unknown")
-            print_status(name, True, version)
-        except ImportError as e:
-            print_status(f"{name} - {e}", False)
-            all_ok = False
-
-    return all_ok
-
-
-def check_vector_and_embeddings() -> bool:
-    """Check vector database and embedding libraries."""
-    print_header("VECTOR DATABASE & EMBEDDINGS")
-    all_ok = True
-
-    # ChromaDB
-    try:
-        import chromadb
-        print_status("ChromaDB", True, chromadb.__version__)
-    except ImportError as e:
-        print_status(f"ChromaDB - {e}", False)
-        all_ok = False
-
-    # FAISS
-    try:
-        import faiss
-        print_status("FAISS-CPU", True, "installed")
-    except ImportError as e:
-        print_status(f"FAISS-CPU - {e}", False)
-        all_ok = False
-
-    # Sentence Transformers
-    try:
-        import sentence_transformers
-        print_status("Sentence-Transformers", True, sentence_transformers.__version__)
-    except ImportError as e:
-        print_status(f"Sentence-Transformers - {e}", False)
-        all_ok = False
-
-    return all_ok
-
-
-def check_llm_libraries() -> bool:
-    """Check LLM integration libraries."""
-    print_header("LLM INTEGRATION")
-    all_ok = True
+def _probe_module(module: str, dist: str) -> str:
+    """
+    Check that a module is installed and return its distribution version.
 
-    # OpenAI
+    Uses find_spec and package metadata so the module body is never executed.
+    """
+    if find_spec(module) is None:
+        raise ModuleNotFoundError(f"No module named '{module}'")
     try:
-        import openai
-        print_status("OpenAI", True, openai.__version__)
-    except ImportError as e:
-        print_status(f"OpenAI - {e}", False)
-        all_ok = False
-
-    # LangChain Core (new package structure)
-    try:
-        import langchain_core
-        print_status("LangChain-Core", True, langchain_core.__version__)
-    except ImportError as e:
-        print_status(f"LangChain-Core - {e}", False)
-        all_ok = False
+        return version(dist)
+    except PackageNotFoundError:
+        return "unknown"
 
-    # LangChain Community
-    try:
-        import langchain_community
-        print_status("LangChain-Community", True, langchain_community.__version__)
-    except ImportError as e:
-        print_status(f"LangChain-Community - {e}", False)
-        all_ok = False
 
-    # LangChain OpenAI
-    try:
-        import langchain_openai
-        from importlib.metadata import version
-        lc_openai_version = version("langchain-openai")
-        print_status("LangChain-OpenAI", True, lc_openai_version)
-    except ImportError as e:
-        print_status(f"LangChain-OpenAI - {e}", False)
-        all_ok = False
+def _load_spacy_model() -> None:
+    """Load the spaCy English model (raises OSError if not installed)."""
+    import spacy
+    spacy.load(SPACY_MODEL)
 
-    # Tiktoken
-    try:
-        import tiktoken
-        print_status("Tiktoken", True, tiktoken.__version__)
-    except ImportError as e:
-        print_status(f"Tiktoken - {e}", False)
-        all_ok = False
 
-    return all_ok
+def run_checks(section: str, entries: List[ImportProbe], probes: Dict[str, Future]) -> bool:
+    """
+    Report the probe results for one section of CHECKS.
 
+    Args:
+        section: Section header to print
+        entries: (module, display name, distribution) triples to report
+        probes: Pending probe results keyed by module name
 
-def check_nlp_libraries() -> bool:
-    """Check NLP libraries."""
-    print_header("NLP LIBRARIES")
+    Returns:
+        True if every library in the section is installed
+    """
+    print_header(section)
     all_ok = True
 
-    # NLTK
-    try:
-        import nltk
-        print_status("NLTK", True, nltk.__version__)
-    except ImportError as e:
-        print_status(f"NLTK - {e}", False)
-        all_ok = False
-
-    # spaCy
-    try:
-        import spacy
-        print_status("spaCy", True, spacy.__version__)
-
-        # Check if model is installed
+    for module, name, _ in entries:
         try:
-            nlp = spacy.load("en_core_web_sm")
-            print_status("spaCy Model (en_core_web_sm)", True, "loaded")
-        except OSError:
-            print_status("spaCy Model (en_core_web_sm) - not installed", False)
-            print("    Run: python -m spacy download en_core_web_sm")
+            installed_version = probes[module].result()
+        except ImportError as e:
+            print_status(f"{name} - {e}", False)
             all_ok = False
-    except ImportError as e:
-        print_status(f"spaCy - {e}", False)
-        all_ok = False
-
-    return all_ok
+            continue
 
+        if module != "spacy":
+            print_status(name, True, installed_version)
+            continue
 
-def check_utilities() -> bool:
-    """Check utility libraries."""
-    print_header("UTILITIES")
-    all_ok = True
-
-    libraries = [
-        ("loguru", "Loguru"),
-        ("tenacity", "Tenacity"),
-        ("dotenv", "python-dotenv"),
-        ("httpx", "HTTPX"),
-    ]
-
-    for module, name in libraries:
+        # spaCy is only found by the probe; loading the model also imports it
         try:
-            lib = __import__(module)
-            version = getattr(lib, "__version__", "installed")
-            print_status(name, True, version)
+            probes[SPACY_MODEL].result()
         except ImportError as e:
             print_status(f"{name} - {e}", False)
             all_ok = False
+            continue
+        except OSError:
+            print_status(name, True, installed_version)
+            print_status(f"spaCy Model ({SPACY_MODEL}) - not installed", False)
+            print(f"    Run: python -m spacy download {SPACY_MODEL}")
+            all_ok = False
+            continue
+
+        print_status(name, True, installed_version)
+        print_status(f"spaCy Model ({SPACY_MODEL})", True, "loaded")
 
     return all_ok
 
@@ -337,15 +266,22 @@ def main():
     print(f"\nProject Root: {project_root}")
     print(f"Python Version: {sys.version.split()[0]}")
 
-    results = []
-
-    # Run all checks
-    results.append(("Core Libraries", check_core_imports()))
-    results.append(("Document Processing", check_document_processing()))
-    results.append(("Vector & Embeddings", check_vector_and_embeddings()))
-    results.append(("LLM Integration", check_llm_libraries()))
-    results.append(("NLP Libraries", check_nlp_libraries()))
-    results.append(("Utilities", check_utilities()))
+    # Run library checks; probes are independent and filesystem bound,
+    # so run them concurrently and report in table order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        probes = {
+            module: executor.submit(_probe_module, module, dist)
+            for _, _, entries in CHECKS
+            for module, _, dist in entries
+        }
+        probes[SPACY_MODEL] = executor.submit(_load_spacy_model)
+
+        results = [
+            (name, run_checks(section, entries, probes))
+            for section, name, entries in CHECKS
+        ]
+
+    # Run remaining checks
     results.append(("Directories", check_directories()))
     results.append(("Configuration", check_configuration()))
     results.append(("Logger", check_logger()))
@@ -7,7 +7,7 @@ and environment variables.
 Features:
 - Loads config.yaml with nested access via dot notation
 - Environment variable loading from .env file
-- Singleton pattern for single config instance
+- Single shared config instance via memoized get_config()
 - Validation of required settings
 - Type hints and clear error messages
 
@@ -25,17 +25,56 @@ Usage:
     is_debug = config.is_debug
 """
 
+import functools
+import hashlib
 import os
+import pickle
+import struct
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, TypeVar, Union
+from types import MappingProxyType
+from typing import (
+    Any, Callable, Dict, Iterator, List, Mapping, Optional, Tuple, TypeVar, Union
+)
 
 import yaml
 from dotenv import load_dotenv
 
+# Prefer the libyaml C loader; fall back to the pure-Python loader
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
+
 
 # Type variable for generic return types
 T = TypeVar("T")
 
+# String values coerced to booleans by ConfigLoader._convert_type (lowercase keys)
+_BOOLS = {
+    "true": True, "yes": True, "1": True, "on": True,
+    "false": False, "no": False, "0": False, "off": False,
+}
+
+# Header of the parsed-config cache: source file mtime (ns) and size in bytes,
+# as little-endian uint64s
+_CACHE_HEADER = struct.Struct("<QQ")
+
+
+def _cache_path(config_path: Path) -> Path:
+    """
+    Locate the parsed-config cache for a YAML file.
+
+    The cache lives in the user cache directory ($XDG_CACHE_HOME/safes, or
+    ~/.cache/safes), keyed by a hash of the config file's absolute path, so
+    reading configuration never writes into the source tree.
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    digest = hashlib.sha256(os.path.abspath(config_path).encode("utf-8")).hexdigest()
+    return Path(cache_home) / "safes" / f"config-{digest[:16]}.pkl"
+
 
 # -----------------------------------------------------------------------------
 # Exceptions
@@ -56,6 +95,75 @@ class InvalidConfigError(ConfigurationError):
     pass
 
 
+# -----------------------------------------------------------------------------
+# Warnings
+# -----------------------------------------------------------------------------
+
+# Warning callable, resolved on first use (logger.warning or a print fallback)
+_warn: Optional[Callable[[str], None]] = None
+
+
+def _emit_warning(message: str) -> None:
+    """
+    Log a configuration warning.
+
+    The logger is imported lazily to avoid a circular dependency, and the
+    lookup is cached so the import is attempted only once per process.
+
+    Args:
+        message: Warning message to emit
+    """
+    global _warn
+    if _warn is None:
+        try:
+            from src.utils.logger import logger
+            _warn = logger.opt(depth=1).warning
+        except ImportError:
+            _warn = lambda msg: print(f"WARNING: {msg}")
+    _warn(message)
+
+
+# -----------------------------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------------------------
+
+def _freeze(node: Any) -> Any:
+    """
+    Recursively wrap nested dictionaries in read-only MappingProxyType views.
+
+    Args:
+        node: Parsed configuration value
+
+    Returns:
+        The value with every nested dict replaced by a read-only view
+    """
+    if isinstance(node, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in node.items()})
+    return node
+
+
+# -----------------------------------------------------------------------------
+# Key Parsing
+# -----------------------------------------------------------------------------
+
+# Translation table mapping dot-notation separators to env var underscores
+_ENV_TRANS = str.maketrans({".": "_"})
+
+
+@functools.lru_cache(maxsize=256)
+def _env_key(key: str) -> str:
+    """
+    Convert a dot-notation key into its environment variable name.
+
+    Args:
+        key: Configuration key in dot notation (e.g., "llm.model")
+
+    Returns:
+        Environment variable name (e.g., "LLM_MODEL")
+    """
+    return key.translate(_ENV_TRANS).upper()
+
+
 # -----------------------------------------------------------------------------
 # Configuration Loader Class
 # -----------------------------------------------------------------------------
@@ -64,55 +172,52 @@ class ConfigLoader:
     """
     Configuration loader with support for YAML files and environment variables.
 
-    Implements singleton pattern to ensure configuration is loaded only once.
-    Provides dot notation access to nested configuration values.
+    Use get_config() to obtain the shared, memoized instance so that
+    configuration is loaded only once. Provides dot notation access to
+    nested configuration values.
 
     Attributes:
         config_path: Path to the YAML configuration file
-        _config: Internal dictionary holding all configuration values
+        _config: Read-only mapping holding all configuration values
         _env_loaded: Whether environment variables have been loaded
+        _env_keys: Snapshot of environment variable names, refreshed on reload()
+        _flat: Dot-notation keys mapped to values, rebuilt on reload()
 
     Example:
-        >>> config = ConfigLoader()
+        >>> config = get_config()
         >>> chunk_size = config.get("document_processing.chunk_size", default=500)
         >>> llm_settings = config.get_section("llm")
         >>> print(config.openai_api_key)
     """
 
-    _instance: Optional["ConfigLoader"] = None
-    _initialized: bool = False
-
-    def __new__(cls, config_path: Optional[str] = None) -> "ConfigLoader":
-        """
-        Implement singleton pattern - return existing instance if available.
-
-        Args:
-            config_path: Optional path to config file (only used on first instantiation)
-
-        Returns:
-            The singleton ConfigLoader instance
-        """
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-        return cls._instance
+    # Core state lives in slots; __dict__ is kept for cached_property values
+    __slots__ = (
+        "_project_root", "_config_path", "_config", "_flat",
+        "_env_loaded", "_env_keys", "_environment", "_is_debug",
+        "_log_level", "_api_host", "_api_port", "__dict__",
+    )
+
+    # Properties memoized with cached_property, cleared on reload()
+    _CACHED_PROPERTIES = (
+        "upload_dir", "processed_dir", "vectordb_dir", "log_dir",
+        "llm_model", "llm_temperature", "llm_max_tokens",
+        "chunk_size", "chunk_overlap", "allowed_extensions", "max_file_size_mb",
+        "retrieval_top_k", "similarity_threshold",
+    )
 
     def __init__(self, config_path: Optional[str] = None) -> None:
         """
         Initialize the configuration loader.
 
         Loads the YAML configuration file and environment variables.
-        Only performs initialization once due to singleton pattern.
 
         Args:
             config_path: Path to YAML config file. Defaults to "configs/config.yaml"
 
         Raises:
             ConfigurationError: If config file cannot be loaded
+            InvalidConfigError: If a resolved setting (e.g. API_PORT) is invalid
         """
-        # Skip if already initialized (singleton)
-        if ConfigLoader._initialized:
-            return
-
         # Determine project root directory
         self._project_root = Path(__file__).parent.parent.parent
 
@@ -123,16 +228,17 @@ class ConfigLoader:
             self._config_path = self._project_root / "configs" / "config.yaml"
 
         # Initialize internal state
-        self._config: Dict[str, Any] = {}
+        self._config: Mapping[str, Any] = MappingProxyType({})
         self._env_loaded: bool = False
 
         # Load configuration
         self._load_env()
+        self._env_keys = frozenset(os.environ)
         self._load_config()
+        self._flat: Dict[str, Any] = dict(self._flatten(self._config))
+        self._resolve_settings()
         self._validate_required()
 
-        ConfigLoader._initialized = True
-
     # -------------------------------------------------------------------------
     # Loading Methods
     # -------------------------------------------------------------------------
@@ -143,15 +249,23 @@ class ConfigLoader:
 
         Searches for .env file in configs/ directory and project root.
         Environment variables take precedence over config file values.
+
+        Set SAFES_SKIP_DOTENV=1 when the environment is already injected
+        (e.g. by a container orchestrator) to skip .env discovery entirely.
         """
+        if _BOOLS.get(os.getenv("SAFES_SKIP_DOTENV", "").lower()):
+            self._env_loaded = True
+            return
+
         # Possible .env locations (in order of precedence)
-        env_paths = [
-            self._project_root / "configs" / ".env",
-            self._project_root / ".env",
-        ]
+        root = str(self._project_root)
+        env_paths = (
+            os.path.join(root, "configs", ".env"),
+            os.path.join(root, ".env"),
+        )
 
         for env_path in env_paths:
-            if env_path.exists():
+            if os.path.isfile(env_path):
                 load_dotenv(env_path)
                 self._env_loaded = True
                 break
@@ -169,9 +283,18 @@ class ConfigLoader:
                 f"Please ensure 'configs/config.yaml' exists."
             )
 
+        # Use the pickled cache if it matches the YAML file's mtime and size
+        st = self._config_path.stat()
+        stamp = (st.st_mtime_ns, st.st_size)
+        cache_path = _cache_path(self._config_path)
+        cached = self._read_cache(cache_path, stamp)
+        if cached is not None:
+            self._config = _freeze(cached)
+            return
+
         try:
             with open(self._config_path, "r", encoding="utf-8") as f:
-                self._config = yaml.safe_load(f) or {}
+                parsed = yaml.load(f.read(), Loader=CSafeLoader) or {}
         except yaml.YAMLError as e:
             raise ConfigurationError(
                 f"Invalid YAML in configuration file: {self._config_path}\n"
@@ -183,6 +306,118 @@ class ConfigLoader:
                 f"Error: {e}"
             )
 
+        self._write_cache(cache_path, stamp, parsed)
+        self._config = _freeze(parsed)
+
+    def _read_cache(
+        self, cache_path: Path, stamp: Tuple[int, int]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Load parsed configuration from the pickle cache.
+
+        Args:
+            cache_path: Path to the cache file
+            stamp: (mtime in nanoseconds, size in bytes) of the YAML file
+
+        Returns:
+            Cached configuration dictionary, or None if missing, stale or corrupt
+        """
+        try:
+            with open(cache_path, "rb") as f:
+                header = f.read(_CACHE_HEADER.size)
+                if len(header) != _CACHE_HEADER.size:
+                    return None
+                if _CACHE_HEADER.unpack(header) != stamp:
+                    return None
+                cached = pickle.load(f)
+        except Exception:
+            return None
+
+        return cached if isinstance(cached, dict) else None
+
+    def _write_cache(
+        self, cache_path: Path, stamp: Tuple[int, int], data: Dict[str, Any]
+    ) -> None:
+        """
+        Atomically write parsed configuration to the pickle cache.
+
+        Failures are ignored; the YAML file is simply parsed again next time.
+
+        Args:
+            cache_path: Path to the cache file
+            stamp: (mtime in nanoseconds, size in bytes) of the YAML file
+            data: Parsed configuration dictionary
+        """
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            os.makedirs(cache_path.parent, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                f.write(_CACHE_HEADER.pack(*stamp))
+                f.write(pickle.dumps(data, protocol=5))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+    def _flatten(self, node: Mapping[str, Any], prefix: str = "") -> Iterator[Tuple[str, Any]]:
+        """
+        Flatten nested configuration into dot-notation key/value pairs.
+
+        Both sections and leaf values are yielded, so "llm" maps to the
+        section dictionary and "llm.model" to the model name.
+
+        Args:
+            node: Nested configuration dictionary
+            prefix: Dot-notation prefix of the current node
+
+        Yields:
+            Tuples of (dot-notation key, value)
+        """
+        for k, v in node.items():
+            key = f"{prefix}.{k}" if prefix else str(k)
+            yield key, v
+            if isinstance(v, Mapping):
+                yield from self._flatten(v, key)
+
+    def _resolve_settings(self) -> None:
+        """
+        Resolve frequently read settings once from env vars and config.
+
+        Backs the environment, is_debug, log_level, api_host and api_port
+        properties; called again by reload(). All values are validated before
+        any is assigned, so a failure leaves the previous settings in place.
+
+        Raises:
+            InvalidConfigError: If the API port is not an integer
+        """
+        environment = os.getenv("ENVIRONMENT", "development").lower()
+
+        # Check environment variable first, then fall back to config file
+        debug_env = os.getenv("DEBUG")
+        if debug_env is not None:
+            is_debug = debug_env.lower() in ("true", "1", "yes", "on")
+        else:
+            is_debug = self.get("app.debug", default=False)
+
+        log_level = os.getenv("LOG_LEVEL", self.get("logging.level", default="INFO")).upper()
+        api_host = os.getenv("API_HOST", self.get("api.host", default="0.0.0.0"))
+
+        raw_port = os.getenv("API_PORT", self.get("api.port", default=8000))
+        try:
+            api_port = int(raw_port)
+        except (TypeError, ValueError):
+            raise InvalidConfigError(
+                f"Invalid API port: {raw_port!r} (set API_PORT or api.port to an integer)"
+            ) from None
+
+        self._environment: str = environment
+        self._is_debug: bool = is_debug
+        self._log_level: str = log_level
+        self._api_host: str = api_host
+        self._api_port: int = api_port
+
     def _validate_required(self) -> None:
         """
         Validate that required configuration values are present.
@@ -203,15 +438,8 @@ class ConfigLoader:
             )
 
         # Log warnings but don't fail (allow app to start for testing)
-        if warnings:
-            # Import here to avoid circular dependency
-            try:
-                from src.utils.logger import logger
-                for warning in warnings:
-                    logger.warning(warning)
-            except ImportError:
-                for warning in warnings:
-                    print(f"WARNING: {warning}")
+        for warning in warnings:
+            _emit_warning(warning)
 
     # -------------------------------------------------------------------------
     # Access Methods
@@ -247,36 +475,32 @@ class ConfigLoader:
             0.3
         """
         # First, check environment variable (with key converted to uppercase)
-        env_key = key.upper().replace(".", "_")
-        env_value = os.getenv(env_key)
-        if env_value is not None:
-            return self._convert_type(env_value)
-
-        # Navigate through nested config
-        keys = key.split(".")
-        value = self._config
-
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                if required:
-                    raise MissingConfigError(
-                        f"Required configuration key not found: '{key}'"
-                    )
-                return default
+        env_key = _env_key(key)
+        if env_key in self._env_keys:
+            env_value = os.environ.get(env_key)
+            if env_value is not None:
+                return self._convert_type(env_value)
 
-        return value
-
-    def get_section(self, section: str) -> Dict[str, Any]:
+        # Look up the flattened dot-notation key
+        try:
+            return self._flat[key]
+        except KeyError:
+            if required:
+                raise MissingConfigError(
+                    f"Required configuration key not found: '{key}'"
+                ) from None
+            return default
+
+    def get_section(self, section: str) -> Mapping[str, Any]:
         """
-        Get an entire configuration section as a dictionary.
+        Get an entire configuration section as a read-only mapping.
 
         Args:
             section: Section name (top-level key in config.yaml)
 
         Returns:
-            Dictionary containing all values in the section
+            Read-only mapping of all values in the section; use
+            dict(config.get_section(...)) for a mutable copy
 
         Raises:
             MissingConfigError: If section doesn't exist
@@ -290,19 +514,20 @@ class ConfigLoader:
             raise MissingConfigError(
                 f"Configuration section not found: '{section}'"
             )
-        return self._config[section].copy()
+        return self._config[section]
 
-    def get_all(self) -> Dict[str, Any]:
+    def get_all(self) -> Mapping[str, Any]:
         """
-        Get the entire configuration as a dictionary.
+        Get the entire configuration as a read-only mapping.
 
         Returns:
-            Complete configuration dictionary
+            Complete configuration mapping
 
         Note:
-            Returns a copy to prevent accidental modification.
+            Returns a read-only view rather than a copy; nested sections
+            are read-only as well.
         """
-        return self._config.copy()
+        return self._config
 
     def _convert_type(self, value: str) -> Any:
         """
@@ -315,10 +540,9 @@ class ConfigLoader:
             Converted value (bool, int, float, or original string)
         """
         # Boolean conversion
-        if value.lower() in ("true", "yes", "1", "on"):
-            return True
-        if value.lower() in ("false", "no", "0", "off"):
-            return False
+        converted = _BOOLS.get(value.lower())
+        if converted is not None:
+            return converted
 
         # Integer conversion
         try:
@@ -344,13 +568,33 @@ class ConfigLoader:
         Reload configuration from file.
 
         Useful for picking up configuration changes without restarting
-        the application.
+        the application. If the new configuration is invalid, the previous
+        configuration is kept.
+
+        Raises:
+            ConfigurationError: If the config file cannot be loaded or a
+                resolved setting is invalid
 
         Example:
             >>> config.reload()  # Refresh config from file
         """
         self._load_env()
-        self._load_config()
+
+        # Restore the previous state if the new configuration fails to load
+        # or validate, so the instance is never left half-updated
+        previous = (self._env_keys, self._config, self._flat)
+        try:
+            self._env_keys = frozenset(os.environ)
+            self._load_config()
+            self._flat = dict(self._flatten(self._config))
+            self._resolve_settings()
+        except ConfigurationError:
+            self._env_keys, self._config, self._flat = previous
+            raise
+
+        # Drop memoized property values so they are recomputed
+        for name in self._CACHED_PROPERTIES:
+            self.__dict__.pop(name, None)
 
     # -------------------------------------------------------------------------
     # Common Properties
@@ -374,7 +618,7 @@ class ConfigLoader:
         Returns:
             Environment string, defaults to "development"
         """
-        return os.getenv("ENVIRONMENT", "development").lower()
+        return self._environment
 
     @property
     def is_debug(self) -> bool:
@@ -384,13 +628,7 @@ class ConfigLoader:
         Returns:
             True if debug mode is enabled
         """
-        # Check environment variable first
-        debug_env = os.getenv("DEBUG")
-        if debug_env is not None:
-            return debug_env.lower() in ("true", "1", "yes", "on")
-
-        # Fall back to config file
-        return self.get("app.debug", default=False)
+        return self._is_debug
 
     @property
     def log_level(self) -> str:
@@ -400,7 +638,7 @@ class ConfigLoader:
         Returns:
             Log level string (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
-        return os.getenv("LOG_LEVEL", self.get("logging.level", default="INFO")).upper()
+        return self._log_level
 
     @property
     def project_root(self) -> Path:
@@ -416,25 +654,25 @@ class ConfigLoader:
     # Path Properties
     # -------------------------------------------------------------------------
 
-    @property
+    @cached_property
     def upload_dir(self) -> Path:
         """Get path to upload directory."""
         path = os.getenv("UPLOAD_DIR", self.get("document_processing.upload_dir", "data/uploads"))
         return self._project_root / path
 
-    @property
+    @cached_property
     def processed_dir(self) -> Path:
         """Get path to processed documents directory."""
         path = os.getenv("PROCESSED_DIR", self.get("document_processing.processed_dir", "data/processed"))
         return self._project_root / path
 
-    @property
+    @cached_property
     def vectordb_dir(self) -> Path:
         """Get path to vector database directory."""
         path = os.getenv("CHROMA_PERSIST_DIR", self.get("vector_database.persist_directory", "data/vectordb"))
         return self._project_root / path
 
-    @property
+    @cached_property
     def log_dir(self) -> Path:
         """Get path to logs directory."""
         return self._project_root / "logs"
@@ -443,17 +681,17 @@ class ConfigLoader:
     # LLM Properties
     # -------------------------------------------------------------------------
 
-    @property
+    @cached_property
     def llm_model(self) -> str:
         """Get the configured LLM model name."""
         return self.get("llm.model", default="gpt-3.5-turbo")
 
-    @property
+    @cached_property
     def llm_temperature(self) -> float:
         """Get the LLM temperature setting."""
         return self.get("llm.temperature", default=0.3)
 
-    @property
+    @cached_property
     def llm_max_tokens(self) -> int:
         """Get the maximum tokens for LLM response."""
         return self.get("llm.max_tokens", default=1500)
@@ -462,22 +700,22 @@ class ConfigLoader:
     # Document Processing Properties
     # -------------------------------------------------------------------------
 
-    @property
+    @cached_property
     def chunk_size(self) -> int:
         """Get text chunk size in tokens."""
         return self.get("document_processing.chunk_size", default=500)
 
-    @property
+    @cached_property
     def chunk_overlap(self) -> int:
         """Get chunk overlap size in tokens."""
         return self.get("document_processing.chunk_overlap", default=50)
 
-    @property
+    @cached_property
     def allowed_extensions(self) -> List[str]:
         """Get list of allowed file extensions."""
         return self.get("document_processing.allowed_extensions", default=[".pdf", ".docx", ".txt", ".md"])
 
-    @property
+    @cached_property
     def max_file_size_mb(self) -> int:
         """Get maximum allowed file size in megabytes."""
         return self.get("document_processing.max_file_size_mb", default=50)
@@ -486,12 +724,12 @@ class ConfigLoader:
     # Retrieval Properties
     # -------------------------------------------------------------------------
 
-    @property
+    @cached_property
     def retrieval_top_k(self) -> int:
         """Get number of chunks to retrieve."""
         return self.get("retrieval.top_k", default=5)
 
-    @property
+    @cached_property
     def similarity_threshold(self) -> float:
         """Get minimum similarity threshold for retrieval."""
         return self.get("retrieval.similarity_threshold", default=0.7)
@@ -503,12 +741,12 @@ class ConfigLoader:
     @property
     def api_host(self) -> str:
         """Get API server host."""
-        return os.getenv("API_HOST", self.get("api.host", default="0.0.0.0"))
+        return self._api_host
 
     @property
     def api_port(self) -> int:
         """Get API server port."""
-        return int(os.getenv("API_PORT", self.get("api.port", default=8000)))
+        return self._api_port
 
     # -------------------------------------------------------------------------
     # Magic Methods
@@ -534,30 +772,48 @@ class ConfigLoader:
 # Global Configuration Instance
 # -----------------------------------------------------------------------------
 
+@functools.lru_cache(maxsize=None)
+def _cached_config(config_path: Optional[str]) -> ConfigLoader:
+    """Create and memoize one ConfigLoader per normalized config path."""
+    return ConfigLoader(config_path)
+
+
 def get_config(config_path: Optional[str] = None) -> ConfigLoader:
     """
     Get the global configuration instance.
 
-    Factory function that returns the singleton ConfigLoader instance.
+    Factory function that returns the memoized ConfigLoader instance.
     Use this or the global `config` variable to access configuration.
 
     Args:
-        config_path: Optional path to config file (only used on first call)
+        config_path: Optional path to config file (defaults to configs/config.yaml)
 
     Returns:
-        The singleton ConfigLoader instance
+        The shared ConfigLoader instance for the given path (relative and
+        absolute spellings of the same file share one instance)
 
     Example:
         >>> from src.utils.config import get_config
         >>> config = get_config()
         >>> print(config.llm_model)
     """
-    return ConfigLoader(config_path)
+    # Normalize so "configs/config.yaml", "./configs/config.yaml" and the
+    # absolute path share one cached loader
+    if config_path:
+        config_path = os.path.abspath(config_path)
+    return _cached_config(config_path)
+
 
+def __getattr__(name: str) -> Any:
+    """
+    Lazily create the global config instance on first access (PEP 562).
 
-# Create global config instance for easy importing
-# Usage: from src.utils.config import config
-config = get_config()
+    Usage: from src.utils.config import config
+    """
+    if name == "config":
+        globals()["config"] = get_config()
+        return globals()["config"]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # -----------------------------------------------------------------------------
@@ -0,0 +1,982 @@
+"""
+Custom Log Sinks for SAFES
+==========================
+Loguru sink implementations used by src.utils.logger.
+
+Sinks:
+- RotatingFile: size-rotated log file with retention and compression hooks
+- DualFileSink: routes each formatted record to an app file and an error file
+- RawFileSink: unbuffered binary append file written with os.write()
+- BatchingSink: coalesces records into one write() per time window
+- IoUringSink: BatchingSink variant that submits writes through io_uring
+- QueueSink: hands formatted records to a dedicated writer thread
+- MmapSink: append-only log file written through a memory-mapped window
+- MmapRingSink: in-memory ring buffer for console output (see scripts/safes_tail.py)
+
+Note:
+    Loguru calls flush() after every record on sink objects that define it,
+    so sinks passed to logger.add() expose drain() instead of flush().
+"""
+
+import glob
+import mmap
+import os
+import queue
+import re
+import struct
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Dict, Optional, Tuple, Union
+
+# Optional: io_uring bindings for IoUringSink (Linux only)
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# POSIX file locks, used by IoUringSink to enforce a single writer
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+# Whether IoUringSink can be used on this platform
+IOURING_AVAILABLE = (
+    sys.platform == "linux"
+    and liburing is not None
+    and fcntl is not None
+    and hasattr(os, "eventfd")
+)
+
+
+# -----------------------------------------------------------------------------
+# Parsing Helpers
+# -----------------------------------------------------------------------------
+
+# Size units (decimal and binary, as accepted by loguru)
+_SIZE_UNITS = {
+    "b": 1,
+    "kb": 10**3, "mb": 10**6, "gb": 10**9,
+    "kib": 2**10, "mib": 2**20, "gib": 2**30,
+}
+
+# Duration units in seconds
+_DURATION_UNITS = {
+    "s": 1, "second": 1, "seconds": 1,
+    "m": 60, "minute": 60, "minutes": 60,
+    "h": 3600, "hour": 3600, "hours": 3600,
+    "d": 86400, "day": 86400, "days": 86400,
+    "w": 604800, "week": 604800, "weeks": 604800,
+}
+
+_QUANTITY_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([a-zA-Z]+)\s*$")
+
+
+def _parse_quantity(value: str, units: dict, kind: str) -> float:
+    """Parse "<number> <unit>" using the given unit table."""
+    match = _QUANTITY_PATTERN.match(value)
+    if not match or match.group(2).lower() not in units:
+        raise ValueError(f"Invalid {kind}: '{value}'")
+    return float(match.group(1)) * units[match.group(2).lower()]
+
+
+def parse_size(value: Union[str, int]) -> int:
+    """
+    Parse a file size such as "10 MB" into bytes.
+
+    Args:
+        value: Size string or a number of bytes
+
+    Returns:
+        Size in bytes
+
+    Raises:
+        ValueError: If the size cannot be parsed
+    """
+    if isinstance(value, int):
+        return value
+    return int(_parse_quantity(value, _SIZE_UNITS, "size"))
+
+
+def parse_duration(value: Union[str, int, float, timedelta]) -> float:
+    """
+    Parse a duration such as "7 days" into seconds.
+
+    Args:
+        value: Duration string, timedelta or a number of seconds
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        ValueError: If the duration cannot be parsed
+    """
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    if isinstance(value, (int, float)):
+        return float(value)
+    return _parse_quantity(value, _DURATION_UNITS, "duration")
+
+
+# -----------------------------------------------------------------------------
+# Batching Writer
+# -----------------------------------------------------------------------------
+
+# How often buffered records are written out (seconds)
+BATCH_FLUSH_INTERVAL = 0.05
+
+# Buffer size that triggers an immediate write (bytes)
+BATCH_MAX_BYTES = 64 * 1024
+
+# Spare preallocated buffers kept per sink for reuse
+BATCH_POOL_SIZE = 4
+
+
+def _write_all(fd: int, data: Union[bytes, bytearray, memoryview]) -> None:
+    """Write all of data to fd, retrying on partial writes."""
+    with memoryview(data) as view:
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+
+
+class RawFileSink:
+    """
+    Append-only log file written with os.write(), bypassing text-mode I/O.
+
+    Records are UTF-8 encoded and written straight to the file descriptor,
+    with no TextIOWrapper or buffer layer in between. Usable as the file
+    opener for RotatingFile; BatchingSink builds on it to coalesce writes.
+
+    Example:
+        >>> sink = RotatingFile("logs/app.log", rotation="10 MB", opener=RawFileSink)
+    """
+
+    # Flags for os.open(); subclasses writing at explicit offsets drop O_APPEND
+    _OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_APPEND
+
+    def __init__(self, path: str) -> None:
+        """
+        Open the file for appending.
+
+        Args:
+            path: Log file path
+        """
+        self._fd = os.open(path, self._OPEN_FLAGS, 0o644)
+
+    def write(self, message: str) -> None:
+        """Encode a formatted record and write it to the file."""
+        self._write_bytes(message.encode("utf-8"))
+
+    def flush(self) -> None:
+        """No-op: records are written unbuffered."""
+
+    def close(self) -> None:
+        """Close the file descriptor."""
+        os.close(self._fd)
+
+    def _write_bytes(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Write encoded records to the file."""
+        _write_all(self._fd, data)
+
+
+class BatchingSink(RawFileSink):
+    """
+    Append-only log file that batches records into few write() syscalls.
+
+    Records are encoded into an in-memory buffer which is written out every
+    flush_interval seconds by a background thread, or immediately once it
+    would grow past max_bytes. Used as the file opener for RotatingFile.
+
+    Buffers are preallocated at max_bytes and filled in place, so appending
+    never reallocates. A flush swaps in a spare buffer from a small pool and
+    writes the full one outside the append lock, then returns it to the pool.
+
+    Example:
+        >>> sink = RotatingFile("logs/app.log", rotation="10 MB", opener=BatchingSink)
+    """
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = BATCH_FLUSH_INTERVAL,
+        max_bytes: int = BATCH_MAX_BYTES,
+    ) -> None:
+        """
+        Open the file and start the flusher thread.
+
+        Args:
+            path: Log file path
+            flush_interval: Seconds between background flushes
+            max_bytes: Buffer size that triggers an immediate flush
+        """
+        super().__init__(path)
+        self._max_bytes = max_bytes
+        self._pool: Deque[bytearray] = deque(maxlen=BATCH_POOL_SIZE)
+        self._buf = bytearray(max_bytes)
+        self._len = 0
+
+        # _lock guards the active buffer; _io_lock orders writes to the file.
+        # _io_lock is acquired while holding _lock so swapped-out buffers are
+        # written in the order they were filled.
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._flush_interval = flush_interval
+        self._flusher = threading.Thread(
+            target=self._flush_periodically, name="log-batch-flusher", daemon=True
+        )
+        self._flusher.start()
+
+    def write(self, message: str) -> None:
+        """Buffer a formatted record, flushing first if it doesn't fit."""
+        data = message.encode("utf-8")
+        size = len(data)
+
+        with self._lock:
+            end = self._len + size
+            if end <= self._max_bytes:
+                self._buf[self._len:end] = data
+                self._len = end
+                return
+
+            # Buffer full: swap it out, then buffer the record or, if it is
+            # larger than a whole buffer, write it straight after
+            full = self._swap_locked()
+            if size <= self._max_bytes:
+                self._buf[:size] = data
+                self._len = size
+                data = None
+            self._io_lock.acquire()
+
+        try:
+            self._write_out(full)
+            if data is not None:
+                self._write_bytes(data)
+        finally:
+            self._io_lock.release()
+
+    def flush(self) -> None:
+        """Write out all buffered records."""
+        # Nothing buffered: skip the locks and buffer swap (the common case
+        # for the periodic flusher on an idle log)
+        if not self._len:
+            return
+
+        with self._lock:
+            full = self._swap_locked()
+            self._io_lock.acquire()
+
+        try:
+            self._write_out(full)
+        finally:
+            self._io_lock.release()
+
+    def close(self) -> None:
+        """Stop the flusher, write remaining records and close the file."""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._flusher.join()
+        self.flush()
+
+        # Wait for any write of a swapped-out buffer still in progress
+        with self._io_lock:
+            super().close()
+
+    def _swap_locked(self) -> Tuple[bytearray, int]:
+        """Replace the active buffer with a pooled one (caller holds _lock)."""
+        full = (self._buf, self._len)
+        self._buf = self._pool.popleft() if self._pool else bytearray(self._max_bytes)
+        self._len = 0
+        return full
+
+    def _write_out(self, full: Tuple[bytearray, int]) -> None:
+        """Write a swapped-out buffer and return it to the pool (caller holds _io_lock)."""
+        buf, length = full
+        if length:
+            with memoryview(buf) as view:
+                self._write_bytes(view[:length])
+        self._pool.append(buf)
+
+    def _flush_periodically(self) -> None:
+        """Flusher loop: write the buffer every flush interval until closed."""
+        while not self._closed.wait(self._flush_interval):
+            try:
+                self.flush()
+            except OSError:
+                sys.stderr.write("--- Logging error in BatchingSink ---\n")
+                traceback.print_exc(file=sys.stderr)
+
+
+# -----------------------------------------------------------------------------
+# io_uring Writer (Linux)
+# -----------------------------------------------------------------------------
+
+# Submission queue size, also the cap on in-flight writes per sink
+IOURING_ENTRIES = 256
+
+# Prepared writes submitted together by one io_uring_submit() call
+IOURING_SUBMIT_BATCH = 32
+
+
+class IoUringSink(BatchingSink):
+    """
+    BatchingSink that hands its writes to the kernel through io_uring.
+
+    Each flushed buffer becomes a write SQE at an explicit file offset, so
+    writes may complete in any order without interleaving. Prepared writes
+    are submitted IOURING_SUBMIT_BATCH at a time, and at every flush. A
+    reaper thread collects completions, finishing short writes with
+    os.pwrite() and reporting errors to stderr. The reaper sleeps on an
+    eventfd registered with the ring rather than io_uring_wait_cqe(), which
+    holds the GIL while blocked.
+
+    Because the write offset is tracked in-process, a file must have a
+    single writer: the sink holds an exclusive flock() on the log file and
+    refuses to open a file another IoUringSink is writing. Don't use it for
+    logs shared by several processes (e.g. uvicorn --workers N), nor
+    alongside appending sinks on the same file.
+
+    Requires Linux and the liburing package (see IOURING_AVAILABLE). The
+    constructor raises OSError if the kernel refuses to set up a ring.
+
+    Example:
+        >>> sink = RotatingFile("logs/app.log", rotation="10 MB", opener=IoUringSink)
+    """
+
+    # Writes go to explicit offsets, which O_APPEND would override
+    _OPEN_FLAGS = os.O_WRONLY | os.O_CREAT
+
+    def __init__(
+        self,
+        path: str,
+        flush_interval: float = BATCH_FLUSH_INTERVAL,
+        max_bytes: int = BATCH_MAX_BYTES,
+    ) -> None:
+        """
+        Set up the ring, open the file and start the flusher and reaper threads.
+
+        Args:
+            path: Log file path
+            flush_interval: Seconds between background flushes
+            max_bytes: Buffer size that triggers an immediate flush
+
+        Raises:
+            OSError: If io_uring is unavailable or the ring cannot be set up
+            RuntimeError: If another process is already writing the file
+        """
+        if not IOURING_AVAILABLE:
+            raise OSError("io_uring is not available (requires Linux and liburing)")
+
+        # Enforce a single writer before touching the file
+        self._lock_fd = os.open(path, os.O_RDONLY | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(self._lock_fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            os.close(self._lock_fd)
+            raise RuntimeError(
+                f"{path} is already written by another process with io_uring; "
+                f"use_iouring=True requires a single writer process per log file"
+            ) from None
+
+        try:
+            self._ring = liburing.Ring()
+            liburing.io_uring_queue_init(IOURING_ENTRIES, self._ring, 0)
+        except BaseException:
+            os.close(self._lock_fd)
+            raise
+        self._eventfd = os.eventfd(0)
+
+        # In-flight writes keyed by SQE user data: (data, file offset).
+        # _io_lock (from BatchingSink) serializes preparing and submitting.
+        self._inflight: Dict[int, Tuple[bytes, int]] = {}
+        self._inflight_changed = threading.Condition()
+        self._next_token = 1
+        self._unsubmitted = 0
+
+        try:
+            liburing.io_uring_register_eventfd(self._ring, self._eventfd)
+            super().__init__(path, flush_interval, max_bytes)
+        except BaseException:
+            liburing.io_uring_queue_exit(self._ring)
+            os.close(self._eventfd)
+            os.close(self._lock_fd)
+            raise
+        self._offset = os.fstat(self._fd).st_size
+
+        self._reaper = threading.Thread(
+            target=self._reap_completions, name="log-iouring-reaper", daemon=True
+        )
+        self._reaper.start()
+
+    def flush(self) -> None:
+        """Submit all buffered records and wait until the kernel has written them."""
+        if not (self._len or self._unsubmitted or self._inflight):
+            return
+
+        super().flush()
+        with self._io_lock:
+            self._submit()
+            submitted = self._next_token
+
+        # Wait for writes up to this flush only; tokens are issued in order,
+        # so the oldest in-flight write comes first in _inflight
+        with self._inflight_changed:
+            self._inflight_changed.wait_for(
+                lambda: not self._inflight or next(iter(self._inflight)) >= submitted
+            )
+
+    def close(self) -> None:
+        """Write remaining records, close the file and tear down the ring."""
+        if self._closed.is_set():
+            return
+        super().close()
+
+        # Wake the reaper with a no-op carrying the reserved token 0
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_nop(sqe)
+        liburing.io_uring_sqe_set_data64(sqe, 0)
+        liburing.io_uring_submit(self._ring)
+        self._reaper.join()
+        liburing.io_uring_queue_exit(self._ring)
+        os.close(self._eventfd)
+        os.close(self._lock_fd)
+
+    def _write_bytes(self, data: Union[bytes, bytearray, memoryview]) -> None:
+        """Queue a write SQE for data at the end of the file (caller holds _io_lock)."""
+        # SQEs take whole bytes objects; copying also frees the batch buffer
+        # for reuse while the write is in flight
+        data = bytes(data)
+
+        with self._inflight_changed:
+            if len(self._inflight) >= IOURING_ENTRIES:
+                self._submit()
+                self._inflight_changed.wait_for(
+                    lambda: len(self._inflight) < IOURING_ENTRIES
+                )
+            token = self._next_token
+            self._next_token += 1
+            self._inflight[token] = (data, self._offset)
+
+        sqe = liburing.io_uring_get_sqe(self._ring)
+        liburing.io_uring_prep_write(sqe, self._fd, data, self._offset)
+        liburing.io_uring_sqe_set_data64(sqe, token)
+        self._offset += len(data)
+        self._unsubmitted += 1
+
+        if self._unsubmitted >= IOURING_SUBMIT_BATCH:
+            self._submit()
+
+    def _submit(self) -> None:
+        """Submit prepared SQEs with a single io_uring_submit() (caller holds _io_lock)."""
+        if self._unsubmitted:
+            liburing.io_uring_submit(self._ring)
+            self._unsubmitted = 0
+
+    def _reap_completions(self) -> None:
+        """Reaper loop: retire completed writes until the stop no-op arrives."""
+        cqe = liburing.Cqe()
+        while True:
+            # Blocks without the GIL until the kernel posts completions
+            os.eventfd_read(self._eventfd)
+            while True:
+                try:
+                    liburing.io_uring_peek_cqe(self._ring, cqe)
+                except BlockingIOError:
+                    break
+                entry = cqe[0]
+                token = liburing.io_uring_cqe_get_data64(entry)
+                result = entry.res
+                liburing.io_uring_cqe_seen(self._ring, entry)
+                if token == 0:
+                    return
+                self._complete(token, result)
+
+    def _complete(self, token: int, result: int) -> None:
+        """Retire one completed write, finishing it if the kernel wrote short."""
+        data, offset = self._inflight[token]
+        try:
+            if result < 0:
+                raise OSError(-result, os.strerror(-result))
+            if result < len(data):
+                self._finish_write(data, offset, result)
+        except OSError:
+            sys.stderr.write("--- Logging error in IoUringSink ---\n")
+            traceback.print_exc(file=sys.stderr)
+
+        with self._inflight_changed:
+            del self._inflight[token]
+            self._inflight_changed.notify_all()
+
+    def _finish_write(self, data: bytes, offset: int, written: int) -> None:
+        """Complete a short io_uring write synchronously."""
+        with memoryview(data) as view:
+            while written < len(data):
+                written += os.pwrite(self._fd, view[written:], offset + written)
+
+
+# -----------------------------------------------------------------------------
+# Rotating File
+# -----------------------------------------------------------------------------
+
+def _open_text(path: str) -> Any:
+    """Open a log file for appending in buffered text mode."""
+    return open(path, "a", encoding="utf-8", buffering=8192)
+
+
+class RotatingFile:
+    """
+    Log file that rotates by size, mirroring loguru's file sink naming.
+
+    On rotation the current file is renamed to
+    "<name>.<YYYY-MM-DD_HH-MM-SS_ffffff><ext>", handed to the compression
+    callable, and files older than the retention period are removed.
+
+    Rotation is size-based only ("10 MB" or a byte count); loguru's time-based
+    rotations such as "00:00" or "1 week" are rejected with ValueError.
+    Retention follows loguru: an int keeps that many rotated files, while a
+    duration ("7 days" or a timedelta) removes files older than it.
+
+    Example:
+        >>> sink = RotatingFile("logs/app.log", rotation="10 MB", retention="7 days")
+        >>> logger.add(QueueSink(sink), format=FILE_FORMAT)
+    """
+
+    def __init__(
+        self,
+        path: Union[str, os.PathLike],
+        rotation: Optional[Union[str, int]] = None,
+        retention: Optional[Union[str, int, float, timedelta]] = None,
+        compression: Optional[Callable[[str], None]] = None,
+        opener: Callable[[str], Any] = _open_text,
+    ) -> None:
+        """
+        Open the log file.
+
+        Args:
+            path: Log file path
+            rotation: Maximum file size before rotating (e.g. "10 MB")
+            retention: Number of rotated files to keep, or their maximum age
+                (e.g. "7 days")
+            compression: Callable applied to each rotated file path
+            opener: Callable returning a file-like writer for a path
+
+        Raises:
+            ValueError: If rotation is not a size or retention cannot be parsed
+        """
+        self._path = os.path.abspath(os.fspath(path))
+        self._max_bytes = None
+        if rotation is not None:
+            try:
+                self._max_bytes = parse_size(rotation)
+            except ValueError:
+                raise ValueError(
+                    f"Unsupported rotation {rotation!r}: only size-based rotation "
+                    f"(e.g. '10 MB') is supported"
+                ) from None
+
+        # int retention keeps that many rotated files; otherwise it is an age
+        self._keep_files: Optional[int] = None
+        self._retention: Optional[float] = None
+        if isinstance(retention, int) and not isinstance(retention, bool):
+            self._keep_files = retention
+        elif retention is not None:
+            self._retention = parse_duration(retention)
+        self._compression = compression
+        self._opener = opener
+
+        os.makedirs(os.path.dirname(self._path), exist_ok=True)
+        # Size is taken before opening: openers may preallocate (MmapSink)
+        self._size = os.path.getsize(self._path) if os.path.exists(self._path) else 0
+        self._file = self._opener(self._path)
+
+    def write(self, message: str) -> None:
+        """Write a formatted record, rotating first if it would exceed the size limit."""
+        # Track the UTF-8 size; ASCII text (the common case) needs no encode
+        size = len(message) if message.isascii() else len(message.encode("utf-8"))
+        if (
+            self._max_bytes is not None
+            and self._size > 0
+            and self._size + size > self._max_bytes
+        ):
+            self._rotate()
+        self._file.write(message)
+        self._size += size
+
+    def drain(self) -> None:
+        """Push buffered data to the operating system."""
+        self._file.flush()
+
+    def stop(self) -> None:
+        """Flush and close the file (called by loguru on handler removal)."""
+        self._file.close()
+
+    def _rotate(self) -> None:
+        """Rename the current file, reopen it, then compress and apply retention."""
+        self._file.close()
+
+        root, ext = os.path.splitext(self._path)
+        rotated = None
+        try:
+            # The file may have been removed externally (logrotate, an operator);
+            # then there is nothing to rename and a fresh file is simply created
+            if os.path.exists(self._path):
+                rotated = f"{root}.{datetime.now():%Y-%m-%d_%H-%M-%S_%f}{ext}"
+                os.rename(self._path, rotated)
+        finally:
+            # Always reopen, so a failed rename can't stop all later writes
+            self._file = self._opener(self._path)
+            self._size = 0
+
+        if rotated is None:
+            return
+        if self._compression is not None:
+            self._compression(rotated)
+        if self._retention is not None or self._keep_files is not None:
+            self._remove_expired(root, ext)
+
+    def _remove_expired(self, root: str, ext: str) -> None:
+        """Delete rotated files (compressed or not) beyond the retention limit."""
+        paths = glob.glob(f"{glob.escape(root)}.*{glob.escape(ext)}*")
+
+        if self._keep_files is not None:
+            # Group each rotated file with its compressed copy (which may still
+            # be in progress) and keep the newest groups; the timestamped names
+            # sort chronologically
+            groups: Dict[str, list] = {}
+            for path in paths:
+                groups.setdefault(path[:path.rindex(ext) + len(ext)], []).append(path)
+            expired = [
+                path
+                for stem in sorted(groups, reverse=True)[self._keep_files:]
+                for path in groups[stem]
+            ]
+        else:
+            cutoff = time.time() - self._retention
+            expired = []
+            for path in paths:
+                try:
+                    if os.path.getmtime(path) < cutoff:
+                        expired.append(path)
+                except OSError:
+                    pass
+
+        for path in expired:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+
+# -----------------------------------------------------------------------------
+# Dual File Sink
+# -----------------------------------------------------------------------------
+
+class DualFileSink:
+    """
+    Single sink that writes each record to an app log and an error log.
+
+    Loguru formats the record once for this sink; the formatted message is
+    then written to each file whose level threshold it meets. This replaces
+    two file handlers that would each filter and format the same record.
+    Each file rotates on its own through RotatingFile's size check.
+
+    Register it at min(app_level, error_level) so both thresholds are
+    reachable; routing compares the record's level number.
+
+    Example:
+        >>> sink = DualFileSink(
+        ...     RotatingFile("logs/app.log"), RotatingFile("logs/error.log"),
+        ...     app_level=20, error_level=40,
+        ... )
+        >>> logger.add(sink, format=FILE_FORMAT, level=min(20, 40))
+    """
+
+    def __init__(self, app_file: Any, error_file: Any, app_level: int, error_level: int) -> None:
+        """
+        Wrap the two log files.
+
+        Args:
+            app_file: Writer for the application log (e.g. a RotatingFile)
+            error_file: Writer for the error log
+            app_level: Minimum level number written to app_file
+            error_level: Minimum level number written to error_file
+        """
+        self._app_file = app_file
+        self._error_file = error_file
+        self._app_level = app_level
+        self._error_level = error_level
+
+    def write(self, message: Any) -> None:
+        """Write a formatted loguru message to the files its level reaches."""
+        level = message.record["level"].no
+        if level >= self._app_level:
+            self._app_file.write(message)
+        if level >= self._error_level:
+            self._error_file.write(message)
+
+    def drain(self) -> None:
+        """Push buffered data of both files to the operating system."""
+        self._app_file.drain()
+        self._error_file.drain()
+
+    def stop(self) -> None:
+        """Close both files (called by loguru on handler removal)."""
+        self._app_file.stop()
+        self._error_file.stop()
+
+
+# -----------------------------------------------------------------------------
+# Queue Sink
+# -----------------------------------------------------------------------------
+
+class QueueSink:
+    """
+    Sink that hands records to a dedicated writer thread via queue.Queue.
+
+    Unlike loguru's enqueue=True (a multiprocessing queue), records are not
+    pickled: the formatted message is passed by reference and written by a
+    single listener thread, which drains the wrapped sink whenever the queue
+    runs empty so bursts are coalesced into fewer writes.
+
+    Example:
+        >>> logger.add(QueueSink(RotatingFile("logs/app.log")), format=FILE_FORMAT)
+    """
+
+    _STOP = object()
+
+    def __init__(self, sink: Any, maxsize: int = 100_000) -> None:
+        """
+        Start the listener thread.
+
+        Args:
+            sink: Object with write(message) and optional drain()/stop()
+            maxsize: Maximum queued records before callers block
+        """
+        self._sink = sink
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=maxsize)
+        self._thread = threading.Thread(
+            target=self._listen, name="log-queue-listener", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, message: str) -> None:
+        """Queue a formatted record, blocking only if the queue is full."""
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            self._queue.put(message)
+
+    def stop(self) -> None:
+        """Write all queued records and stop the wrapped sink."""
+        self._queue.put(self._STOP)
+        self._thread.join()
+
+    def _listen(self) -> None:
+        """Listener loop: write records, draining when the queue is empty."""
+        drain = getattr(self._sink, "drain", None)
+        while True:
+            message = self._queue.get()
+            if message is self._STOP:
+                break
+            try:
+                self._sink.write(message)
+                if drain is not None and self._queue.empty():
+                    drain()
+            except Exception:
+                # Keep the listener alive; report like loguru's catch=True
+                sys.stderr.write("--- Logging error in QueueSink ---\n")
+                traceback.print_exc(file=sys.stderr)
+
+        stop = getattr(self._sink, "stop", None)
+        if stop is not None:
+            stop()
+
+
+# -----------------------------------------------------------------------------
+# Memory-Mapped Appender
+# -----------------------------------------------------------------------------
+
+# Size of the file region MmapSink maps at a time (bytes)
+MMAP_SINK_SIZE = 256 << 20
+
+
+class MmapSink:
+    """
+    Append-only log file written by copying records into a memory map.
+
+    The file is extended by MMAP_SINK_SIZE and mapped as a window starting at
+    the current end of the log, so a write is a memcpy into the page cache
+    with no syscall. When a record doesn't fit in the window, the next window
+    is mapped from the write position. On close the file is truncated to the
+    bytes actually written, so no zero padding is left behind (a crash can
+    leave padding at the end of the file).
+
+    Usable as the file opener for RotatingFile.
+
+    Example:
+        >>> sink = RotatingFile("logs/fast.log", rotation="10 MB", opener=MmapSink)
+    """
+
+    def __init__(self, path: str, size: int = MMAP_SINK_SIZE) -> None:
+        """
+        Open the file and map the first window after its existing contents.
+
+        Args:
+            path: Log file path
+            size: Window size in bytes (rounded up to the allocation granularity)
+        """
+        granularity = mmap.ALLOCATIONGRANULARITY
+        self._window = max(granularity, -(-size // granularity) * granularity)
+        self._fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._pos = os.fstat(self._fd).st_size
+        self._lock = threading.Lock()
+        try:
+            self._map(0)
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def write(self, message: str) -> None:
+        """Copy a formatted record into the map, remapping if it doesn't fit."""
+        data = message.encode("utf-8")
+        size = len(data)
+
+        with self._lock:
+            start = self._pos - self._base
+            if start + size > self._window:
+                self._mm.close()
+                self._map(size)
+                start = self._pos - self._base
+            self._mm[start:start + size] = data
+            self._pos += size
+
+    def flush(self) -> None:
+        """No-op: mapped writes are already in the page cache."""
+
+    def close(self) -> None:
+        """Unmap, trim the file to the written length and close it."""
+        with self._lock:
+            self._mm.close()
+            os.ftruncate(self._fd, self._pos)
+            os.close(self._fd)
+
+    def _map(self, min_size: int) -> None:
+        """Extend the file and map a window from the write position (caller holds _lock)."""
+        granularity = mmap.ALLOCATIONGRANULARITY
+        self._base = self._pos - self._pos % granularity
+        length = self._window
+        while self._pos - self._base + min_size > length:
+            length += self._window
+        os.ftruncate(self._fd, self._base + length)
+        self._mm = mmap.mmap(self._fd, length, offset=self._base)
+
+
+# -----------------------------------------------------------------------------
+# Memory-Mapped Ring Buffer
+# -----------------------------------------------------------------------------
+
+# Ring file header: data capacity and total bytes ever written (little-endian)
+RING_HEADER = struct.Struct("<QQ")
+
+# Offset of the total-bytes-written counter within the header
+RING_TOTAL_OFFSET = 8
+
+
+class MmapRingSink:
+    """
+    Sink that writes records into a memory-mapped ring buffer file.
+
+    Records are copied into shared memory instead of being written to a
+    terminal, so logging costs a memcpy rather than a write() syscall. The
+    oldest output is overwritten once the ring is full. Follow the output
+    with scripts/safes_tail.py. Only one process should write to a ring file.
+    The file is opened without following symlinks and is private to its owner.
+
+    Layout: RING_HEADER (capacity, total bytes written) followed by the data
+    region; the write position is total % capacity.
+
+    Example:
+        >>> logger.add(MmapRingSink("/dev/shm/safes-log"), format=CONSOLE_FORMAT, colorize=False)
+    """
+
+    def __init__(self, path: Union[str, os.PathLike], size: int = 64 << 20) -> None:
+        """
+        Create (or reset) the ring file and map it into memory.
+
+        Args:
+            path: Ring file path, ideally on a RAM-backed filesystem
+            size: Total file size in bytes, including the header
+
+        Raises:
+            OSError: If path is a symlink or is owned by another user
+        """
+        self._capacity = size - RING_HEADER.size
+        if self._capacity <= 0:
+            raise ValueError(f"Ring size too small: {size}")
+
+        # Refuse symlinks and files owned by another user: the ring usually
+        # lives at a predictable path in a shared directory
+        flags = os.O_RDWR | os.O_CREAT | getattr(os, "O_NOFOLLOW", 0)
+        fd = os.open(os.fspath(path), flags, 0o600)
+        try:
+            if hasattr(os, "getuid") and os.fstat(fd).st_uid != os.getuid():
+                raise PermissionError(f"Ring file is owned by another user: {path}")
+            if hasattr(os, "fchmod"):
+                os.fchmod(fd, 0o600)
+            os.ftruncate(fd, size)
+            self._mm = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        self._total = 0
+        self._lock = threading.Lock()
+        RING_HEADER.pack_into(self._mm, 0, self._capacity, self._total)
+
+    def write(self, message: str) -> None:
+        """Copy a formatted record into the ring, wrapping at the end."""
+        data = message.encode("utf-8")
+        if len(data) > self._capacity:
+            data = data[-self._capacity:]
+        size = len(data)
+
+        with self._lock:
+            offset = self._total % self._capacity
+            first = min(size, self._capacity - offset)
+            start = RING_HEADER.size + offset
+            self._mm[start:start + first] = data[:first]
+            if first < size:
+                self._mm[RING_HEADER.size:RING_HEADER.size + size - first] = data[first:]
+
+            # Publish the new total only after the data is in place
+            self._total += size
+            struct.pack_into("<Q", self._mm, RING_TOTAL_OFFSET, self._total)
+
+    def stop(self) -> None:
+        """Unmap the ring (the file is kept so it can still be read)."""
+        with self._lock:
+            self._mm.close()
+
+
+# -----------------------------------------------------------------------------
+# Module Exports
+# -----------------------------------------------------------------------------
+
+__all__ = [
+    "RotatingFile",
+    "DualFileSink",
+    "RawFileSink",
+    "BatchingSink",
+    "IoUringSink",
+    "IOURING_AVAILABLE",
+    "QueueSink",
+    "MmapSink",
+    "MmapRingSink",
+    "parse_size",
+    "parse_duration",
+]
@@ -6,29 +6,63 @@ Comprehensive logging utility using loguru with console and file handlers.
 Features:
 - Colored console output for development
 - Rotating file logs with retention
-- Separate error log file
+- Separate error log file, written by the same handler as the app log
 - Contextual logging with module/function/line info
+- Non-blocking sinks: records are handed to a background writer thread
 """
 
+import atexit
+import functools
+import os
 import sys
+import tempfile
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
 from loguru import logger
 
+from src.utils.log_sinks import (
+    BatchingSink,
+    DualFileSink,
+    IOURING_AVAILABLE,
+    IoUringSink,
+    MmapRingSink,
+    MmapSink,
+    QueueSink,
+    RotatingFile,
+)
+
+# Optional: zstd compression for rotated logs (falls back to zip)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 
 # -----------------------------------------------------------------------------
 # Configuration Constants
 # -----------------------------------------------------------------------------
 
 # Base directory for logs (relative to project root)
-LOG_DIR = Path(__file__).parent.parent.parent / "logs"
+LOG_DIR = Path(__file__).resolve().parents[2] / "logs"
 
 # Log file paths
 APP_LOG_FILE = LOG_DIR / "app.log"
 ERROR_LOG_FILE = LOG_DIR / "error.log"
-
-# Log formats
+FAST_LOG_FILE = LOG_DIR / "fast.log"
+
+# String copies resolved once, so setup_logger() does no path arithmetic
+# for the default location
+_LOG_DIR_STR = str(LOG_DIR)
+_APP_LOG = str(APP_LOG_FILE)
+_ERR_LOG = str(ERROR_LOG_FILE)
+_FAST_LOG = str(FAST_LOG_FILE)
+
+# Log formats. Kept as static strings: loguru parses them (including color
+# markup) once in logger.add(), whereas a callable format returns a template
+# that is re-prepared for every record.
 CONSOLE_FORMAT = (
     "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
     "<level>{level: <8}</level> | "
@@ -47,6 +81,17 @@ FILE_FORMAT = (
 ROTATION_SIZE = "10 MB"
 RETENTION_PERIOD = "7 days"
 
+# Memory-mapped console ring buffer (setup_logger(use_mmap_console=True)).
+# Named per user so rings of different users never collide.
+MMAP_CONSOLE_PATH = os.path.join(
+    "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir(),
+    f"safes-log-{os.getuid() if hasattr(os, 'getuid') else os.getpid()}",
+)
+MMAP_CONSOLE_SIZE = 64 << 20
+
+# zstd level for rotated logs (fast, with a good ratio for log text)
+ZSTD_LEVEL = 3
+
 
 # -----------------------------------------------------------------------------
 # Logger State
@@ -54,6 +99,82 @@ RETENTION_PERIOD = "7 days"
 
 _logger_initialized = False
 
+# Whether any sink accepts DEBUG records; decorators applied while this is
+# False return the function unwrapped. Updated by setup_logger().
+_DEBUG_ENABLED = True
+
+# Whether decorators attach tracebacks to exception logs; follows the
+# diagnose setting of setup_logger()
+_TRACEBACKS_ENABLED = False
+
+
+# -----------------------------------------------------------------------------
+# Compression
+# -----------------------------------------------------------------------------
+
+def _zstd_compress(path: str) -> None:
+    """
+    Compress a rotated log file to <path>.zst and remove the original.
+
+    Args:
+        path: Path of the rotated log file (passed by loguru)
+    """
+    cctx = zstandard.ZstdCompressor(level=ZSTD_LEVEL, threads=-1)
+    with open(path, "rb") as src, open(f"{path}.zst", "wb") as dst:
+        cctx.copy_stream(src, dst)
+    os.remove(path)
+
+
+def _zip_compress(path: str) -> None:
+    """
+    Compress a rotated log file to <path>.zip and remove the original.
+
+    Fallback used when zstandard is not installed.
+
+    Args:
+        path: Path of the rotated log file (passed by loguru)
+    """
+    with zipfile.ZipFile(f"{path}.zip", "w", compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.write(path, os.path.basename(path))
+    os.remove(path)
+
+
+# Compressor for rotated logs: zstd when available, else zip
+_compress = _zstd_compress if zstandard is not None else _zip_compress
+
+# Single background worker so rotation never blocks the log writer thread
+_ROTATION_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="log-rotate")
+atexit.register(_ROTATION_POOL.shutdown, wait=True)
+
+
+def _compress_in_background(path: str) -> None:
+    """Compress a rotated log file, reporting failures to stderr."""
+    try:
+        _compress(path)
+    except Exception as e:
+        sys.stderr.write(f"Failed to compress rotated log {path}: {e}\n")
+
+
+def _async_compress(path: str) -> None:
+    """
+    Schedule compression of a rotated log file and return immediately.
+
+    Loguru has already renamed the file, so the sink keeps writing to a
+    fresh file while compression runs on the rotation pool.
+
+    Args:
+        path: Path of the rotated log file (passed by loguru)
+    """
+    try:
+        _ROTATION_POOL.submit(_compress_in_background, path)
+    except RuntimeError:
+        # Pool already shut down (interpreter exit): compress inline
+        _compress_in_background(path)
+
+
+# Compression hook for rotated logs
+ROTATION_COMPRESSION = _async_compress
+
 
 # -----------------------------------------------------------------------------
 # Setup Functions
@@ -63,11 +184,16 @@ def setup_logger(
     console_level: str = "DEBUG",
     file_level: str = "INFO",
     error_level: str = "ERROR",
-    log_dir: Optional[Path] = None,
-    rotation: str = ROTATION_SIZE,
-    retention: str = RETENTION_PERIOD,
+    log_dir: Optional[Union[str, Path]] = None,
+    rotation: Union[str, int] = ROTATION_SIZE,
+    retention: Union[str, int] = RETENTION_PERIOD,
     colorize: bool = True,
-    diagnose: bool = True,
+    diagnose: bool = False,
+    enqueue: bool = True,
+    fast_queue: bool = False,
+    use_mmap_console: bool = False,
+    use_iouring: bool = False,
+    fast_log: bool = False,
 ) -> None:
     """
     Configure the application-wide logger with console and file handlers.
@@ -77,24 +203,62 @@ def setup_logger(
         file_level: Minimum log level for app.log file (default: INFO)
         error_level: Minimum log level for error.log file (default: ERROR)
         log_dir: Directory for log files (default: project_root/logs)
-        rotation: When to rotate log files (default: "10 MB")
-        retention: How long to keep old logs (default: "7 days")
-        colorize: Enable colored console output (default: True)
-        diagnose: Show variable values in tracebacks (default: True, disable in production)
+        rotation: Maximum log file size before rotating, as a size string or byte
+            count; time-based rotation is not supported (default: "10 MB")
+        retention: How long to keep old logs as a duration, or an int number of
+            rotated files to keep (default: "7 days")
+        colorize: Enable colored console output when stderr is a terminal; output
+            redirected to a pipe or file is never colored (default: True)
+        diagnose: Show variable values in tracebacks and attach tracebacks to
+            decorator exception logs (default: False; opt in for debugging sessions,
+            as it repr()s every frame local and, with enqueue, pickles them across
+            the queue)
+        enqueue: Hand records to a background writer thread so logging calls don't
+            block on I/O (default: True)
+        fast_queue: Write file logs from an in-process queue.Queue listener thread
+            instead of loguru's enqueue, avoiding per-record pickling (default: False)
+        use_mmap_console: Write console output to a shared-memory ring buffer at
+            MMAP_CONSOLE_PATH instead of stderr; follow it with
+            scripts/safes_tail.py (default: False)
+        use_iouring: Submit file log writes through io_uring on Linux when the
+            liburing package is installed; falls back to regular batched writes
+            elsewhere. Requires a single writer process per log directory (not
+            for uvicorn --workers N); raises RuntimeError if another process is
+            already writing the same files with io_uring (default: False)
+        fast_log: Also write every record from TRACE up to fast.log through a
+            memory-mapped appender on the calling thread, for low-latency request
+            tracing (default: False)
 
     Example:
         >>> from src.utils.logger import setup_logger, get_logger
         >>> setup_logger(console_level="INFO")
         >>> logger = get_logger(__name__)
         >>> logger.info("Application started")
+        >>> setup_logger(diagnose=True)  # Debugging session: full tracebacks
     """
-    global _logger_initialized
-
-    # Determine log directory
-    logs_path = log_dir or LOG_DIR
+    global _logger_initialized, _DEBUG_ENABLED, _TRACEBACKS_ENABLED
+
+    # Determine log directory and file paths
+    if log_dir is None:
+        logs_path, app_log, error_log = _LOG_DIR_STR, _APP_LOG, _ERR_LOG
+        fast_log_file = _FAST_LOG
+    else:
+        logs_path = os.path.abspath(log_dir)
+        app_log = os.path.join(logs_path, "app.log")
+        error_log = os.path.join(logs_path, "error.log")
+        fast_log_file = os.path.join(logs_path, "fast.log")
 
     # Create logs directory if it doesn't exist
-    logs_path.mkdir(parents=True, exist_ok=True)
+    os.makedirs(logs_path, exist_ok=True)
+
+    # Resolve level names to numbers once. Handlers are added with numeric
+    # levels, which loguru compares directly against each record's level
+    # number; no filter callables, so records below every handler's level
+    # still return early in logger._log().
+    console_level_no = logger.level(console_level.upper()).no
+    file_level_no = logger.level(file_level.upper()).no
+    error_level_no = logger.level(error_level.upper()).no
+    trace_level_no = logger.level("TRACE").no
 
     # Remove default handler
     logger.remove()
@@ -103,50 +267,130 @@ def setup_logger(
     # Console Handler
     # -------------------------------------------------------------------------
     # Colored output for development, shows all levels from console_level up
-    logger.add(
-        sys.stderr,
-        format=CONSOLE_FORMAT,
-        level=console_level.upper(),
-        colorize=colorize,
-        diagnose=diagnose,
-        backtrace=True,
-    )
+    if use_mmap_console:
+        # Ring buffer writes are a memcpy, so they stay on the caller thread
+        logger.add(
+            MmapRingSink(MMAP_CONSOLE_PATH, size=MMAP_CONSOLE_SIZE),
+            format=CONSOLE_FORMAT,
+            level=console_level_no,
+            colorize=False,
+            diagnose=diagnose,
+            backtrace=True,
+            enqueue=False,
+        )
+    else:
+        logger.add(
+            sys.stderr,
+            format=CONSOLE_FORMAT,
+            level=console_level_no,
+            colorize=colorize and sys.stderr.isatty(),
+            diagnose=diagnose,
+            backtrace=True,
+            enqueue=enqueue,
+        )
 
     # -------------------------------------------------------------------------
-    # Application Log File Handler
+    # File Handler (app.log + error.log)
     # -------------------------------------------------------------------------
-    # Rotates at specified size, retains for specified period
+    # One handler formats each record once and routes it by level: app.log
+    # gets file_level and up, error.log gets error_level and up. Each file
+    # rotates at the specified size and is retained for the specified period.
     logger.add(
-        logs_path / "app.log",
+        **_file_sink_options(
+            app_log, error_log, file_level_no, error_level_no, rotation, retention,
+            enqueue, fast_queue, use_iouring,
+        ),
         format=FILE_FORMAT,
-        level=file_level.upper(),
-        rotation=rotation,
-        retention=retention,
-        compression="zip",  # Compress rotated logs
-        encoding="utf-8",
+        level=min(file_level_no, error_level_no),
         diagnose=diagnose,
         backtrace=True,
     )
 
     # -------------------------------------------------------------------------
-    # Error Log File Handler
+    # Fast Trace Log Handler (optional)
     # -------------------------------------------------------------------------
-    # Separate file for errors only, easier to monitor critical issues
-    logger.add(
-        logs_path / "error.log",
-        format=FILE_FORMAT,
-        level=error_level.upper(),
-        rotation=rotation,
-        retention=retention,
-        compression="zip",
-        encoding="utf-8",
-        diagnose=diagnose,
-        backtrace=True,
-    )
+    # Mapped writes are a memcpy, so they stay on the caller thread
+    if fast_log:
+        logger.add(
+            RotatingFile(
+                fast_log_file,
+                rotation,
+                retention,
+                compression=ROTATION_COMPRESSION,
+                opener=MmapSink,
+            ),
+            format=FILE_FORMAT,
+            level=trace_level_no,
+            diagnose=diagnose,
+            backtrace=True,
+            enqueue=False,
+        )
 
     _logger_initialized = True
+    _DEBUG_ENABLED = (
+        fast_log or min(console_level_no, file_level_no) <= logger.level("DEBUG").no
+    )
+    _TRACEBACKS_ENABLED = diagnose
     logger.info("Logger initialized successfully")
-    logger.debug(f"Log directory: {logs_path.absolute()}")
+    logger.debug(f"Log directory: {logs_path}")
+
+
+def _file_sink_options(
+    app_log: str,
+    error_log: str,
+    file_level_no: int,
+    error_level_no: int,
+    rotation: Union[str, int],
+    retention: Union[str, int],
+    enqueue: bool,
+    fast_queue: bool,
+    use_iouring: bool = False,
+) -> Dict[str, Any]:
+    """
+    Build the sink-specific logger.add() options for app.log and error.log.
+
+    Both files sit behind a single DualFileSink, and records are batched by
+    BatchingSink so that bursts cost one write() syscall per flush window
+    instead of one per record.
+
+    Args:
+        app_log: Application log file path
+        error_log: Error log file path
+        file_level_no: Minimum level number written to app.log
+        error_level_no: Minimum level number written to error.log
+        rotation: Maximum file size before rotating
+        retention: How long to keep rotated files, or how many to keep
+        enqueue: Use loguru's background writer (ignored with fast_queue)
+        fast_queue: Write through an in-process QueueSink listener thread
+        use_iouring: Write through IoUringSink where io_uring is available
+
+    Returns:
+        Keyword arguments for logger.add()
+    """
+    opener = _open_iouring if use_iouring and IOURING_AVAILABLE else BatchingSink
+    app_file, error_file = (
+        RotatingFile(
+            path,
+            rotation,
+            retention,
+            compression=ROTATION_COMPRESSION,  # Compress rotated logs
+            opener=opener,
+        )
+        for path in (app_log, error_log)
+    )
+    sink = DualFileSink(app_file, error_file, file_level_no, error_level_no)
+    if fast_queue:
+        return {"sink": QueueSink(sink), "enqueue": False}
+    return {"sink": sink, "enqueue": enqueue}
+
+
+def _open_iouring(path: str) -> BatchingSink:
+    """Open a log file with IoUringSink, falling back to BatchingSink if io_uring is refused."""
+    try:
+        return IoUringSink(path)
+    except OSError as e:
+        sys.stderr.write(f"io_uring unavailable for {path} ({e}); using batched writes\n")
+        return BatchingSink(path)
 
 
 def get_logger(name: str) -> "logger":
@@ -168,11 +412,21 @@ def get_logger(name: str) -> "logger":
         >>> logger.info("Processing document")
         >>> logger.error("Failed to parse PDF", exc_info=True)
     """
-    # Auto-initialize with defaults if not already done
+    _ensure_initialized()
+
+    # Return logger bound with module name context
+    return _bound_logger(name)
+
+
+def _ensure_initialized() -> None:
+    """Auto-initialize the logger with defaults if not already done."""
     if not _logger_initialized:
         setup_logger()
 
-    # Return logger bound with module name context
+
+@functools.lru_cache(maxsize=None)
+def _bound_logger(name: str) -> "logger":
+    """Bind the logger to a module name once and reuse it for repeat callers."""
     return logger.bind(name=name)
 
 
@@ -180,6 +434,19 @@ def get_logger(name: str) -> "logger":
 # Utility Functions
 # -----------------------------------------------------------------------------
 
+def _log_exception(func_name: str, exc: BaseException) -> None:
+    """
+    Log an exception caught by a decorator, attributed to the wrapper frame.
+
+    The traceback is only attached when tracebacks are enabled, since
+    formatting it (and diagnosing frames) is expensive on every re-raise.
+    """
+    if _TRACEBACKS_ENABLED:
+        logger.opt(exception=exc, depth=1).error("Exception in {}: {}", func_name, exc)
+    else:
+        logger.opt(exception=False, depth=1).error("Exception in {}: {}", func_name, exc)
+
+
 def log_function_call(func):
     """
     Decorator to automatically log function entry and exit.
@@ -187,51 +454,117 @@ def log_function_call(func):
     Logs the function name, arguments, and return value (or exception).
     Useful for debugging complex call chains.
 
+    When DEBUG logging is disabled at decoration time, the function is
+    returned unwrapped so calls carry no tracing overhead. Use
+    log_function_call_with_errors to always capture exceptions.
+
     Example:
         >>> @log_function_call
         ... def process_document(doc_id: str, options: dict):
         ...     return {"status": "success"}
     """
-    from functools import wraps
+    if not _DEBUG_ENABLED:
+        return func
+
+    func_name = func.__qualname__
 
-    @wraps(func)
+    @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        func_name = func.__qualname__
-        logger.debug(f"Entering {func_name} | args={args}, kwargs={kwargs}")
+        # Lazy args are only evaluated (and repr'd) if a sink accepts DEBUG
+        logger.opt(lazy=True).debug(
+            "Entering {} | args={}, kwargs={}",
+            lambda: func_name, lambda: args, lambda: kwargs,
+        )
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"Exiting {func_name} | result={result}")
+            logger.opt(lazy=True).debug(
+                "Exiting {} | result={}", lambda: func_name, lambda: result
+            )
             return result
         except Exception as e:
-            logger.exception(f"Exception in {func_name}: {e}")
+            _log_exception(func_name, e)
+            raise
+
+    return wrapper
+
+
+def log_function_call_with_errors(func):
+    """
+    Decorator to log exceptions raised by a function, without entry/exit tracing.
+
+    Always applied regardless of the log level, for callers that only need
+    error capture.
+
+    Example:
+        >>> @log_function_call_with_errors
+        ... def parse_pdf(path: str):
+        ...     ...
+    """
+    func_name = func.__qualname__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        except Exception as e:
+            _log_exception(func_name, e)
             raise
 
     return wrapper
 
 
+def log_if_debug(func):
+    """
+    Decorator that applies log_function_call only when running without -O.
+
+    __debug__ is a compile-time constant, so under ``python -O`` the check
+    folds away and the function is returned undecorated: no wrapper, no
+    per-call cost. Prefer this for per-call tracing, and keep
+    log_function_call for call logging that must also run in optimized
+    production builds.
+
+    Example:
+        >>> @log_if_debug
+        ... def score_chunk(chunk: str) -> float:
+        ...     return 0.5
+    """
+    if not __debug__:
+        return func
+    return log_function_call(func)
+
+
 def log_async_function_call(func):
     """
     Decorator to automatically log async function entry and exit.
 
-    Same as log_function_call but for async functions.
+    Same as log_function_call but for async functions, including returning
+    the function unwrapped when DEBUG logging is disabled.
 
     Example:
         >>> @log_async_function_call
         ... async def fetch_data(url: str):
         ...     return await http_client.get(url)
     """
-    from functools import wraps
+    if not _DEBUG_ENABLED:
+        return func
+
+    func_name = func.__qualname__
 
-    @wraps(func)
+    @functools.wraps(func)
     async def wrapper(*args, **kwargs):
-        func_name = func.__qualname__
-        logger.debug(f"Entering {func_name} | args={args}, kwargs={kwargs}")
+        # Lazy args are only evaluated (and repr'd) if a sink accepts DEBUG
+        logger.opt(lazy=True).debug(
+            "Entering {} | args={}, kwargs={}",
+            lambda: func_name, lambda: args, lambda: kwargs,
+        )
         try:
             result = await func(*args, **kwargs)
-            logger.debug(f"Exiting {func_name} | result={result}")
+            logger.opt(lazy=True).debug(
+                "Exiting {} | result={}", lambda: func_name, lambda: result
+            )
             return result
         except Exception as e:
-            logger.exception(f"Exception in {func_name}: {e}")
+            _log_exception(func_name, e)
             raise
 
     return wrapper
@@ -242,7 +575,9 @@ class LogContext:
     Context manager for adding temporary context to log messages.
 
     Useful for adding request IDs, user IDs, or other contextual information
-    to all log messages within a specific scope.
+    to all log messages within a specific scope. Built on logger.contextualize(),
+    so the context is scoped to the current thread or asyncio task and removed
+    on exit.
 
     Example:
         >>> with LogContext(request_id="abc-123", user_id="user-456"):
@@ -251,15 +586,15 @@ class LogContext:
 
     def __init__(self, **context):
         self.context = context
-        self._token = None
+        self._cm = None
 
     def __enter__(self):
-        self._token = logger.configure(extra=self.context)
+        self._cm = logger.contextualize(**self.context)
+        self._cm.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        # Context is automatically cleaned up
-        pass
+        return self._cm.__exit__(exc_type, exc_val, exc_tb)
 
 
 def set_log_level(level: str) -> None:
@@ -291,6 +626,8 @@ __all__ = [
     "setup_logger",
     "get_logger",
     "log_function_call",
+    "log_function_call_with_errors",
+    "log_if_debug",
     "log_async_function_call",
     "LogContext",
     "set_log_level",
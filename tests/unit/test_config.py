@@ -0,0 +1,208 @@
+# Unit Tests for Configuration
+
+import os
+
+import pytest
+import yaml
+
+from src.utils import config as config_module
+from src.utils.config import (
+    ConfigLoader,
+    InvalidConfigError,
+    MissingConfigError,
+    _cache_path,
+    _cached_config,
+    get_config,
+)
+
+
+CONFIG_YAML = """\
+app:
+  debug: false
+api:
+  host: 127.0.0.1
+  port: 8000
+llm:
+  model: gpt-3.5-turbo
+  temperature: 0.3
+document_processing:
+  chunk_size: 500
+"""
+
+
+@pytest.fixture(autouse=True)
+def isolated_env(tmp_path, monkeypatch):
+    """Keep the cache, .env files and overriding env vars out of the tests."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "cache"))
+    monkeypatch.setenv("SAFES_SKIP_DOTENV", "1")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+    for name in ("API_PORT", "API_HOST", "DEBUG", "LOG_LEVEL", "LLM_MODEL", "LLM", "ENVIRONMENT"):
+        monkeypatch.delenv(name, raising=False)
+    _cached_config.cache_clear()
+    yield
+    _cached_config.cache_clear()
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a minimal config.yaml and return its path."""
+    path = tmp_path / "config.yaml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    return path
+
+
+def _fail_yaml_load(monkeypatch):
+    """Make any YAML parse fail, so a successful load proves the cache was used."""
+
+    def fail(*args, **kwargs):
+        raise AssertionError("YAML was parsed")
+
+    monkeypatch.setattr(yaml, "load", fail)
+
+
+# -----------------------------------------------------------------------------
+# Parsed-Config Cache
+# -----------------------------------------------------------------------------
+
+class TestConfigCache:
+    """Tests for the pickled config cache."""
+
+    def test_cache_written_outside_source_tree(self, tmp_path, config_file):
+        ConfigLoader(str(config_file))
+        cache = _cache_path(config_file)
+        assert cache.exists()
+        assert cache.parent == tmp_path / "cache" / "safes"
+        assert sorted(p.name for p in config_file.parent.iterdir()) == ["cache", "config.yaml"]
+
+    def test_cache_hit_skips_yaml_parse(self, config_file, monkeypatch):
+        ConfigLoader(str(config_file))
+        _fail_yaml_load(monkeypatch)
+        loader = ConfigLoader(str(config_file))
+        assert loader.get("llm.model") == "gpt-3.5-turbo"
+
+    def test_stale_cache_on_size_change(self, config_file):
+        ConfigLoader(str(config_file))
+        config_file.write_text(CONFIG_YAML.replace("gpt-3.5-turbo", "gpt-4"), encoding="utf-8")
+        assert ConfigLoader(str(config_file)).get("llm.model") == "gpt-4"
+
+    def test_stale_cache_on_mtime_change(self, config_file):
+        ConfigLoader(str(config_file))
+        st = config_file.stat()
+
+        # Same size, different content and mtime
+        config_file.write_text(CONFIG_YAML.replace("port: 8000", "port: 9000"), encoding="utf-8")
+        os.utime(config_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        assert config_file.stat().st_size == st.st_size
+        assert ConfigLoader(str(config_file)).get("api.port") == 9000
+
+    @pytest.mark.parametrize("content", [b"", b"short", b"\0" * 16 + b"not a pickle"])
+    def test_corrupt_cache_falls_back_to_yaml(self, config_file, content):
+        ConfigLoader(str(config_file))
+        cache = _cache_path(config_file)
+        cache.write_bytes(content)
+
+        loader = ConfigLoader(str(config_file))
+        assert loader.get("llm.model") == "gpt-3.5-turbo"
+        # The cache is rewritten with valid data
+        assert cache.read_bytes() != content
+
+    def test_corrupt_pickle_with_valid_header(self, config_file):
+        ConfigLoader(str(config_file))
+        cache = _cache_path(config_file)
+        header = cache.read_bytes()[:16]
+        cache.write_bytes(header + b"garbage")
+        assert ConfigLoader(str(config_file)).get("api.port") == 8000
+
+
+# -----------------------------------------------------------------------------
+# Environment Overrides and Reload
+# -----------------------------------------------------------------------------
+
+class TestConfigReload:
+    """Tests for environment overrides and reload()."""
+
+    def test_env_override_converts_type(self, config_file, monkeypatch):
+        monkeypatch.setenv("DOCUMENT_PROCESSING_CHUNK_SIZE", "750")
+        loader = ConfigLoader(str(config_file))
+        assert loader.get("document_processing.chunk_size") == 750
+
+    def test_new_env_var_needs_reload(self, config_file, monkeypatch):
+        loader = ConfigLoader(str(config_file))
+        monkeypatch.setenv("LLM_MODEL", "gpt-4")
+
+        # Variables set after loading are outside the snapshot until reload()
+        assert loader.get("llm.model") == "gpt-3.5-turbo"
+        loader.reload()
+        assert loader.get("llm.model") == "gpt-4"
+
+    def test_reload_picks_up_file_changes(self, config_file):
+        loader = ConfigLoader(str(config_file))
+        assert loader.chunk_size == 500
+        config_file.write_text(CONFIG_YAML.replace("chunk_size: 500", "chunk_size: 1000"))
+        loader.reload()
+        assert loader.chunk_size == 1000
+        assert loader.get("document_processing.chunk_size") == 1000
+
+    def test_invalid_port_raises(self, config_file, monkeypatch):
+        monkeypatch.setenv("API_PORT", "not-a-port")
+        with pytest.raises(InvalidConfigError, match="API port"):
+            ConfigLoader(str(config_file))
+
+    def test_reload_restores_state_on_invalid_port(self, config_file, monkeypatch):
+        loader = ConfigLoader(str(config_file))
+        config_file.write_text(CONFIG_YAML.replace("gpt-3.5-turbo", "gpt-4-turbo"))
+        monkeypatch.setenv("API_PORT", "not-a-port")
+
+        with pytest.raises(InvalidConfigError):
+            loader.reload()
+
+        assert loader.api_port == 8000
+        assert loader.get("llm.model") == "gpt-3.5-turbo"
+        assert loader.get_section("llm")["model"] == "gpt-3.5-turbo"
+        # The failed reload's env snapshot was discarded as well
+        assert loader.get("api.port") == 8000
+
+
+# -----------------------------------------------------------------------------
+# Access Methods
+# -----------------------------------------------------------------------------
+
+class TestConfigAccess:
+    """Tests for get(), get_section() and get_config()."""
+
+    def test_get_section_key_returns_section(self, config_file):
+        loader = ConfigLoader(str(config_file))
+        assert dict(loader.get("llm")) == {"model": "gpt-3.5-turbo", "temperature": 0.3}
+        assert loader.get("llm.missing", default="x") == "x"
+        assert "llm.model" in loader
+        assert "llm.missing" not in loader
+
+    def test_get_required_missing(self, config_file):
+        loader = ConfigLoader(str(config_file))
+        with pytest.raises(MissingConfigError):
+            loader.get("nope.nothing", required=True)
+
+    def test_get_section_is_read_only(self, config_file):
+        loader = ConfigLoader(str(config_file))
+        section = loader.get_section("llm")
+        with pytest.raises(TypeError):
+            section["model"] = "gpt-4"
+        with pytest.raises(TypeError):
+            loader.get_all()["llm"] = {}
+        assert loader.get("llm.model") == "gpt-3.5-turbo"
+
+    def test_get_section_missing(self, config_file):
+        loader = ConfigLoader(str(config_file))
+        with pytest.raises(MissingConfigError):
+            loader.get_section("missing")
+
+    def test_get_config_normalizes_path(self, tmp_path, config_file, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        shared = get_config("config.yaml")
+        assert get_config("./config.yaml") is shared
+        assert get_config(str(config_file)) is shared
+        assert get_config(str(tmp_path / "." / "config.yaml")) is shared
+
+    def test_module_config_is_shared_instance(self, monkeypatch):
+        monkeypatch.delitem(config_module.__dict__, "config", raising=False)
+        assert config_module.config is get_config()
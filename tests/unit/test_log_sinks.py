@@ -0,0 +1,425 @@
+# Unit Tests for Log Sinks
+
+import glob
+import importlib.util
+import mmap
+import os
+import threading
+import time
+from datetime import timedelta
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from src.utils.log_sinks import (
+    IOURING_AVAILABLE,
+    RING_HEADER,
+    BatchingSink,
+    DualFileSink,
+    IoUringSink,
+    MmapRingSink,
+    MmapSink,
+    QueueSink,
+    RawFileSink,
+    RotatingFile,
+)
+
+
+def _load_safes_tail():
+    """Import scripts/safes_tail.py (the scripts directory is not a package)."""
+    path = Path(__file__).parents[2] / "scripts" / "safes_tail.py"
+    spec = importlib.util.spec_from_file_location("safes_tail", path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+class _Message(str):
+    """Stand-in for loguru's Message: a str carrying its record."""
+
+    def __new__(cls, text, level_no):
+        message = super().__new__(cls, text)
+        message.record = {"level": SimpleNamespace(no=level_no)}
+        return message
+
+
+def _write_concurrently(sink, threads=8, lines=500):
+    """Write numbered lines from several threads and return the expected lines."""
+
+    def worker(t):
+        for i in range(lines):
+            sink.write(f"thread-{t} line-{i}\n")
+
+    workers = [threading.Thread(target=worker, args=(t,)) for t in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+
+
+def _assert_ordered_per_thread(path, threads=8, lines=500):
+    """Check every line was written once and each thread's lines are in order."""
+    seen = {t: [] for t in range(threads)}
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
+        thread, number = line.split()
+        seen[int(thread.split("-")[1])].append(int(number.split("-")[1]))
+    for t in range(threads):
+        assert seen[t] == list(range(lines))
+
+
+def _rotated_files(path):
+    """Rotated siblings of a log file (excluding the live file)."""
+    root, ext = os.path.splitext(str(path))
+    return sorted(glob.glob(f"{glob.escape(root)}.*{glob.escape(ext)}"))
+
+
+# -----------------------------------------------------------------------------
+# Write Ordering and Flushing
+# -----------------------------------------------------------------------------
+
+class TestBatchingSink:
+    """Tests for BatchingSink and RawFileSink."""
+
+    def test_raw_file_sink_appends(self, tmp_path):
+        path = tmp_path / "raw.log"
+        path.write_text("existing\n", encoding="utf-8")
+        sink = RawFileSink(str(path))
+        sink.write("héllo\n")
+        sink.close()
+        assert path.read_text(encoding="utf-8") == "existing\nhéllo\n"
+
+    def test_write_ordering_across_threads(self, tmp_path):
+        path = tmp_path / "batch.log"
+        # A small buffer forces many swaps and direct writes under contention
+        sink = BatchingSink(str(path), flush_interval=0.001, max_bytes=256)
+        _write_concurrently(sink)
+        sink.close()
+        _assert_ordered_per_thread(path)
+
+    def test_record_larger_than_buffer(self, tmp_path):
+        path = tmp_path / "batch.log"
+        sink = BatchingSink(str(path), flush_interval=60, max_bytes=16)
+        sink.write("short\n")
+        sink.write("x" * 100 + "\n")
+        sink.write("tail\n")
+        sink.close()
+        assert path.read_text() == "short\n" + "x" * 100 + "\ntail\n"
+
+    def test_close_flushes_buffer(self, tmp_path):
+        path = tmp_path / "batch.log"
+        sink = BatchingSink(str(path), flush_interval=60)
+        sink.write("buffered\n")
+        assert path.read_text() == ""
+        sink.close()
+        assert path.read_text() == "buffered\n"
+
+    def test_close_is_idempotent(self, tmp_path):
+        sink = BatchingSink(str(tmp_path / "batch.log"))
+        sink.close()
+        sink.close()
+
+    def test_rotating_file_stop_flushes(self, tmp_path):
+        path = tmp_path / "app.log"
+        sink = RotatingFile(path, opener=lambda p: BatchingSink(p, flush_interval=60))
+        sink.write("line\n")
+        sink.stop()
+        assert path.read_text() == "line\n"
+
+    def test_queue_sink_stop_writes_queued_records(self, tmp_path):
+        path = tmp_path / "app.log"
+        sink = QueueSink(RotatingFile(path))
+        for i in range(1000):
+            sink.write(f"{i}\n")
+        sink.stop()
+        assert path.read_text().splitlines() == [str(i) for i in range(1000)]
+
+
+# -----------------------------------------------------------------------------
+# Rotation and Retention
+# -----------------------------------------------------------------------------
+
+class TestRotatingFile:
+    """Tests for RotatingFile."""
+
+    def test_rotates_by_size(self, tmp_path):
+        path = tmp_path / "app.log"
+        sink = RotatingFile(path, rotation=100)
+        for _ in range(5):
+            sink.write("x" * 49 + "\n")
+        sink.stop()
+
+        rotated = _rotated_files(path)
+        assert len(rotated) == 2
+        assert all(os.path.getsize(p) == 100 for p in rotated)
+        assert os.path.getsize(path) == 50
+
+    def test_accepts_size_strings(self, tmp_path):
+        sink = RotatingFile(tmp_path / "app.log", rotation="1 KB")
+        sink.write("x" * 1000)
+        sink.write("x" * 100)
+        sink.stop()
+        assert len(_rotated_files(tmp_path / "app.log")) == 1
+
+    def test_counts_non_ascii_bytes(self, tmp_path):
+        path = tmp_path / "app.log"
+        sink = RotatingFile(path, rotation=10)
+        # 6 characters, 12 bytes in UTF-8: must not be treated as 6
+        sink.write("éééééé")
+        sink.write("a")
+        sink.stop()
+
+        rotated = _rotated_files(path)
+        assert len(rotated) == 1
+        assert os.path.getsize(rotated[0]) == 12
+        assert path.read_text(encoding="utf-8") == "a"
+
+    def test_existing_file_size_counts(self, tmp_path):
+        path = tmp_path / "app.log"
+        path.write_text("x" * 90)
+        sink = RotatingFile(path, rotation=100)
+        sink.write("y" * 20)
+        sink.stop()
+        assert len(_rotated_files(path)) == 1
+        assert path.read_text() == "y" * 20
+
+    @pytest.mark.parametrize("rotation", ["00:00", "1 week", "monday"])
+    def test_rejects_time_based_rotation(self, tmp_path, rotation):
+        with pytest.raises(ValueError, match="Unsupported rotation"):
+            RotatingFile(tmp_path / "app.log", rotation=rotation)
+
+    def test_int_retention_keeps_newest_files(self, tmp_path):
+        path = tmp_path / "app.log"
+        sink = RotatingFile(path, rotation=10, retention=2)
+        for i in range(6):
+            sink.write(f"record-{i:03d}\n")
+            time.sleep(0.002)
+        sink.stop()
+
+        rotated = _rotated_files(path)
+        assert len(rotated) == 2
+        assert [Path(p).read_text() for p in rotated] == ["record-003\n", "record-004\n"]
+        assert path.read_text() == "record-005\n"
+
+    @pytest.mark.parametrize("retention", ["1 hour", timedelta(hours=1)])
+    def test_duration_retention_removes_old_files(self, tmp_path, retention):
+        path = tmp_path / "app.log"
+        old = tmp_path / "app.2020-01-01_00-00-00_000000.log"
+        old_compressed = tmp_path / "app.2020-01-01_00-00-01_000000.log.zst"
+        for stale in (old, old_compressed):
+            stale.write_text("old\n")
+            two_hours_ago = time.time() - 7200
+            os.utime(stale, (two_hours_ago, two_hours_ago))
+
+        sink = RotatingFile(path, rotation=10, retention=retention)
+        sink.write("first-record\n")
+        sink.write("second-record\n")
+        sink.stop()
+
+        assert not old.exists()
+        assert not old_compressed.exists()
+        assert [Path(p).read_text() for p in _rotated_files(path)] == ["first-record\n"]
+
+    def test_compression_called_with_rotated_path(self, tmp_path):
+        path = tmp_path / "app.log"
+        compressed = []
+        sink = RotatingFile(path, rotation=10, compression=compressed.append)
+        sink.write("first-record\n")
+        sink.write("second-record\n")
+        sink.stop()
+        assert compressed == _rotated_files(path)
+
+    def test_rotation_after_file_removed(self, tmp_path):
+        path = tmp_path / "app.log"
+        compressed = []
+        sink = RotatingFile(path, rotation=20, compression=compressed.append)
+        sink.write("first-record\n")
+        os.remove(path)
+
+        # Rotating with the file gone must not raise or stop later writes
+        sink.write("second-record\n")
+        sink.write("third\n")
+        sink.stop()
+
+        assert path.read_text() == "second-record\nthird\n"
+        assert _rotated_files(path) == []
+        assert compressed == []
+
+    def test_failed_rename_reopens_file(self, tmp_path, monkeypatch):
+        path = tmp_path / "app.log"
+        sink = RotatingFile(path, rotation=10)
+        sink.write("first-record\n")
+
+        def fail_rename(src, dst):
+            raise PermissionError("rename refused")
+
+        monkeypatch.setattr(os, "rename", fail_rename)
+        with pytest.raises(PermissionError):
+            sink.write("second-record\n")
+        monkeypatch.undo()
+
+        # The file was reopened, so logging carries on
+        sink.write("third\n")
+        sink.stop()
+        assert path.read_text().endswith("third\n")
+
+
+# -----------------------------------------------------------------------------
+# Dual File Sink
+# -----------------------------------------------------------------------------
+
+class TestDualFileSink:
+    """Tests for DualFileSink level routing."""
+
+    def test_routes_by_level(self, tmp_path):
+        app, error = tmp_path / "app.log", tmp_path / "error.log"
+        sink = DualFileSink(RotatingFile(app), RotatingFile(error), app_level=20, error_level=40)
+        sink.write(_Message("debug\n", 10))
+        sink.write(_Message("info\n", 20))
+        sink.write(_Message("warning\n", 30))
+        sink.write(_Message("error\n", 40))
+        sink.write(_Message("critical\n", 50))
+        sink.stop()
+
+        assert app.read_text() == "info\nwarning\nerror\ncritical\n"
+        assert error.read_text() == "error\ncritical\n"
+
+    def test_error_level_below_app_level(self, tmp_path):
+        app, error = tmp_path / "app.log", tmp_path / "error.log"
+        sink = DualFileSink(RotatingFile(app), RotatingFile(error), app_level=40, error_level=30)
+        sink.write(_Message("warning\n", 30))
+        sink.write(_Message("error\n", 40))
+        sink.drain()
+        sink.stop()
+
+        assert app.read_text() == "error\n"
+        assert error.read_text() == "warning\nerror\n"
+
+
+# -----------------------------------------------------------------------------
+# Memory-Mapped Sinks
+# -----------------------------------------------------------------------------
+
+class TestMmapSink:
+    """Tests for MmapSink."""
+
+    def test_close_trims_padding(self, tmp_path):
+        path = tmp_path / "fast.log"
+        sink = MmapSink(str(path), size=mmap.ALLOCATIONGRANULARITY)
+        sink.write("héllo\n")
+        assert os.path.getsize(path) >= mmap.ALLOCATIONGRANULARITY
+        sink.close()
+        assert path.read_bytes() == "héllo\n".encode("utf-8")
+
+    def test_remaps_past_window_and_appends(self, tmp_path):
+        path = tmp_path / "fast.log"
+        path.write_bytes(b"existing\n")
+        window = mmap.ALLOCATIONGRANULARITY
+        record = "y" * 999 + "\n"
+
+        sink = MmapSink(str(path), size=window)
+        for _ in range(3 * window // len(record)):
+            sink.write(record)
+        sink.write("z" * (2 * window) + "\n")
+        sink.close()
+
+        expected = b"existing\n" + record.encode() * (3 * window // len(record))
+        expected += b"z" * (2 * window) + b"\n"
+        assert path.read_bytes() == expected
+
+
+class TestMmapRingSink:
+    """Tests for MmapRingSink and safes_tail."""
+
+    def test_wrap_around_read_back(self, tmp_path):
+        safes_tail = _load_safes_tail()
+        path = tmp_path / "ring"
+        capacity = 16
+        sink = MmapRingSink(path, size=RING_HEADER.size + capacity)
+        sink.write("0123456789")
+        sink.write("abcdefghij")
+        sink.stop()
+
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            assert RING_HEADER.unpack_from(mm, 0) == (capacity, 20)
+            total = safes_tail.read_total(mm)
+            data = safes_tail.read_range(mm, capacity, total - capacity, total)
+        finally:
+            mm.close()
+        assert data == b"456789abcdefghij"
+
+    def test_oversized_record_keeps_tail(self, tmp_path):
+        safes_tail = _load_safes_tail()
+        path = tmp_path / "ring"
+        sink = MmapRingSink(path, size=RING_HEADER.size + 8)
+        sink.write("0123456789")
+        sink.stop()
+
+        with open(path, "rb") as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            total = safes_tail.read_total(mm)
+            assert safes_tail.read_range(mm, 8, total - 8, total) == b"23456789"
+        finally:
+            mm.close()
+
+    def test_ring_file_is_private(self, tmp_path):
+        path = tmp_path / "ring"
+        path.write_bytes(b"")
+        os.chmod(path, 0o644)
+        MmapRingSink(path, size=RING_HEADER.size + 16).stop()
+        assert os.stat(path).st_mode & 0o777 == 0o600
+
+    def test_refuses_symlink(self, tmp_path):
+        target = tmp_path / "target"
+        target.write_bytes(b"")
+        link = tmp_path / "ring"
+        link.symlink_to(target)
+        with pytest.raises(OSError):
+            MmapRingSink(link, size=RING_HEADER.size + 16)
+
+    def test_tail_rejects_truncated_ring(self, tmp_path, monkeypatch, capsys):
+        safes_tail = _load_safes_tail()
+        path = tmp_path / "ring"
+        path.write_bytes(b"\0" * (RING_HEADER.size - 1))
+        monkeypatch.setattr("sys.argv", ["safes_tail.py", "--path", str(path), "--no-follow"])
+        assert safes_tail.main() == 1
+        assert "Ring buffer not found" in capsys.readouterr().err
+
+
+# -----------------------------------------------------------------------------
+# io_uring Writer
+# -----------------------------------------------------------------------------
+
+@pytest.mark.skipif(not IOURING_AVAILABLE, reason="io_uring is not available")
+class TestIoUringSink:
+    """Tests for IoUringSink."""
+
+    def test_write_ordering_across_threads(self, tmp_path):
+        path = tmp_path / "uring.log"
+        sink = IoUringSink(str(path), flush_interval=0.001, max_bytes=256)
+        _write_concurrently(sink)
+        sink.close()
+        _assert_ordered_per_thread(path)
+
+    def test_appends_to_existing_file(self, tmp_path):
+        path = tmp_path / "uring.log"
+        path.write_text("existing\n")
+        sink = IoUringSink(str(path), flush_interval=60)
+        sink.write("new\n")
+        sink.close()
+        assert path.read_text() == "existing\nnew\n"
+
+    def test_rejects_second_writer(self, tmp_path):
+        path = str(tmp_path / "uring.log")
+        sink = IoUringSink(path)
+        try:
+            with pytest.raises(RuntimeError, match="single writer"):
+                IoUringSink(path)
+        finally:
+            sink.close()
+
+        # The lock is released on close
+        IoUringSink(path).close()